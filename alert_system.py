@@ -3,7 +3,9 @@ import logging
 from twilio.rest import Client
 from datetime import datetime, timedelta
 import json
-import pandas as pd
+import re
+import hashlib
+import numpy as np
 
 # Setup logging
 logging.basicConfig(
@@ -13,6 +15,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# pyahocorasick provides the fast keyword scanner; fall back to a compiled regex without it
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Try to get credentials from Streamlit secrets first, fall back to environment variables
 try:
     import streamlit as st
@@ -25,90 +33,359 @@ except (KeyError, FileNotFoundError, ImportError):
     TWILIO_AUTH_TOKEN = os.environ.get('TWILIO_AUTH_TOKEN')
     TWILIO_PHONE_NUMBER = os.environ.get('TWILIO_PHONE_NUMBER')
     
-# File to store alert history to avoid duplicate alerts
-ALERT_HISTORY_FILE = 'alert_history.json'
+# Scraped news data saved by the app, and the CSV format older versions saved
+NEWS_DATA_FILE = 'cybersecurity_news.parquet'
+LEGACY_NEWS_DATA_FILE = 'cybersecurity_news.csv'
+
+# Append-only file of alerted news IDs (one JSON string per line) to avoid duplicate alerts.
+# IDs are fixed-size digests of "source:headline" so the history stays compact.
+ALERT_HISTORY_FILE = 'alert_history.jsonl'
+
+# Small sidecar file holding the time of the last alert check
+ALERT_HISTORY_META_FILE = 'alert_history_meta.json'
+
+# Single JSON file older versions kept the alert history and last check time in
+LEGACY_ALERT_HISTORY_FILE = 'alert_history.json'
+
+# Matches every character that is not an ASCII digit (used to sanitize phone numbers)
+NON_DIGIT_PATTERN = re.compile(r'[^0-9]')
+
+# Twilio client shared by all alerts so its HTTP connection pool is reused
+twilio_client = None
+
+# Sources to prioritize (government and authority sources)
+PRIORITY_SOURCES = frozenset({'CERT-In', 'NCIIPC', 'I4C', 'NASSCOM'})
+MEDIUM_PRIORITY_SOURCES = frozenset({'The Economic Times', 'The Hindu', 'Times of India', 'India Today'})
+
+# Source priority scores (used to rank items for the digest)
+SOURCE_PRIORITY_SCORES = {
+    'CERT-In': 10, 
+    'NCIIPC': 9,
+    'I4C': 8,
+    'NASSCOM': 7,
+    'The Economic Times': 5,
+    'The Hindu': 5,
+    'Times of India': 5,
+    'India Today': 5
+}
+
+# Keywords that suggest critical security news - grouped by severity
+SEVERITY_HIGH_KEYWORDS = (
+    'critical', 'urgent', 'emergency', 'severe', 'zero-day', 'zero day', 
+    'ransomware', 'remote code execution', 'data breach', 'national security'
+)
+
+SEVERITY_MEDIUM_KEYWORDS = (
+    'vulnerability', 'exploit', 'breach', 'attack', 'compromise', 'warning',
+    'malware', 'backdoor', 'data leak', 'hack', 'phishing campaign'
+)
+
+SEVERITY_LOW_KEYWORDS = (
+    'alert', 'security update', 'patch', 'advisory', 'update available',
+    'security issue', 'cybersecurity', 'threat'
+)
+
+# Severity keywords with scores (used to rank items for the digest)
+SEVERITY_SCORES = {
+    'critical': 10,
+    'urgent': 10,
+    'emergency': 10,
+    'severe': 9,
+    'zero-day': 9,
+    'zero day': 9,
+    'ransomware': 8,
+    'remote code execution': 8,
+    'data breach': 8,
+    'national security': 8,
+    'vulnerability': 7,
+    'exploit': 7,
+    'breach': 6,
+    'attack': 6,
+    'compromise': 6,
+    'warning': 5,
+    'malware': 5,
+    'backdoor': 5,
+    'data leak': 5,
+    'hack': 5,
+    'phishing campaign': 5,
+    'alert': 4,
+    'security update': 3,
+    'patch': 3,
+    'advisory': 3,
+    'update available': 2,
+    'security issue': 2,
+    'cybersecurity': 1,
+    'threat': 1
+}
+
+# Column order of the keyword hit matrix and the matching severity score vector
+KEYWORD_INDEX = {keyword: index for index, keyword in enumerate(SEVERITY_SCORES)}
+KEYWORD_SCORE_VECTOR = np.array(list(SEVERITY_SCORES.values()), dtype=np.int32)
+
+# Hit matrix columns belonging to each severity level
+HIGH_KEYWORD_COLUMNS = np.array([KEYWORD_INDEX[keyword] for keyword in SEVERITY_HIGH_KEYWORDS])
+MEDIUM_KEYWORD_COLUMNS = np.array([KEYWORD_INDEX[keyword] for keyword in SEVERITY_MEDIUM_KEYWORDS])
+
+class KeywordPattern:
+    """
+    Pure-stdlib stand-in for an Aho-Corasick automaton, used when pyahocorasick
+    is not installed. A single compiled alternation inside a lookahead reports
+    every keyword occurrence (including overlapping ones, e.g. "breach" inside
+    "data breach") in one regex scan, with the same iter() interface. Only the
+    longest keyword is reported per start position, which is exact as long as
+    no keyword is a prefix of another.
+    """
+    def __init__(self, keyword_index):
+        self.keyword_index = keyword_index
+        # Longest keywords first so the alternation prefers the full phrase at each position
+        keywords = sorted(keyword_index, key=len, reverse=True)
+        self.pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in keywords) + '))')
+    
+    def iter(self, text):
+        for match in self.pattern.finditer(text):
+            keyword = match.group(1)
+            yield match.start() + len(keyword) - 1, (self.keyword_index[keyword], keyword)
+
+def build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over all alert keywords so that a text
+    can be scanned for every keyword in a single pass.
+    Each keyword maps to a precomputed (column index, keyword) tuple.
+    """
+    if ahocorasick is None:
+        logger.warning("pyahocorasick not installed, using regex keyword matching")
+        return KeywordPattern(KEYWORD_INDEX)
+    
+    automaton = ahocorasick.Automaton()
+    
+    for keyword, index in KEYWORD_INDEX.items():
+        automaton.add_word(keyword, (index, keyword))
+    
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = build_keyword_automaton()
+
+def keyword_hit_matrix(texts):
+    """
+    Build a (texts x keywords) 0/1 matrix marking which keywords appear in
+    each lowercased text, using one automaton pass per text.
+    """
+    rows, columns = [], []
+    for row, text in enumerate(texts):
+        for _, (index, _) in KEYWORD_AUTOMATON.iter(text):
+            rows.append(row)
+            columns.append(index)
+    
+    hits = np.zeros((len(texts), len(KEYWORD_INDEX)), dtype=np.int8)
+    hits[rows, columns] = 1
+    return hits
+
+def lowercase_news_text(news_df):
+    """Combine headline and content into one lowercased text per row (missing text counts as empty)"""
+    return (news_df['headline'].fillna('').astype(str).str.lower() + " " +
+            news_df['content'].fillna('').astype(str).str.lower())
+
+def load_news_data():
+    """
+    Load the scraped news data.
+    Reads the Parquet file saved by the app, falling back to the legacy CSV
+    (parsed with the multithreaded pyarrow engine) when it is missing or older.
+    """
+    # pandas is only needed when the alert system loads the data itself, so it is
+    # imported here to keep it off the import path of SMS-only callers
+    import pandas as pd
+    
+    if os.path.exists(NEWS_DATA_FILE) and (
+            not os.path.exists(LEGACY_NEWS_DATA_FILE) or
+            os.path.getmtime(NEWS_DATA_FILE) >= os.path.getmtime(LEGACY_NEWS_DATA_FILE)):
+        return pd.read_parquet(NEWS_DATA_FILE)
+    
+    return pd.read_csv(LEGACY_NEWS_DATA_FILE, engine='pyarrow')
+
+def hash_alert_id(news_id):
+    """Reduce a "source:headline" ID to a fixed-size hex digest for the alert history"""
+    return hashlib.blake2b(news_id.encode('utf-8'), digest_size=16).hexdigest()
+
+def migrate_legacy_alert_history():
+    """
+    Carry the alerted IDs and last check time over from the legacy alert history
+    file, so items alerted before the upgrade are not alerted again
+    """
+    try:
+        with open(LEGACY_ALERT_HISTORY_FILE, 'r') as f:
+            legacy_history = json.load(f)
+        
+        news_ids = [hash_alert_id(news_id) for news_id in legacy_history.get('alerts_sent', [])]
+        # Create the new history even when there is nothing to carry over, so this only runs once
+        with open(ALERT_HISTORY_FILE, 'a', buffering=1 << 16) as f:
+            f.writelines(json.dumps(news_id) + '\n' for news_id in news_ids)
+        
+        if legacy_history.get('last_check') and load_last_check() is None:
+            save_last_check(legacy_history['last_check'])
+        
+        logger.info(f"Migrated {len(news_ids)} alerted IDs from {LEGACY_ALERT_HISTORY_FILE}")
+    except Exception as e:
+        logger.error(f"Error migrating legacy alert history: {str(e)}")
 
 def load_alert_history():
-    """Load history of alerts that have already been sent"""
+    """Load the set of alert IDs that have already been sent"""
+    if not os.path.exists(ALERT_HISTORY_FILE) and os.path.exists(LEGACY_ALERT_HISTORY_FILE):
+        migrate_legacy_alert_history()
+    
     try:
-        if os.path.exists(ALERT_HISTORY_FILE):
-            with open(ALERT_HISTORY_FILE, 'r') as f:
-                return json.load(f)
-        return {'alerts_sent': [], 'last_check': None}
+        if not os.path.exists(ALERT_HISTORY_FILE):
+            return frozenset()
+        
+        news_ids = set()
+        with open(ALERT_HISTORY_FILE, 'r', buffering=1 << 16) as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                # Decode each line on its own so a line torn by a crash mid-append
+                # only loses that ID instead of the whole history
+                try:
+                    news_id = json.loads(line)
+                except ValueError:
+                    news_id = None
+                if not isinstance(news_id, str):
+                    logger.warning(f"Skipping unreadable line {line_number} of {ALERT_HISTORY_FILE}")
+                    continue
+                # Histories written before IDs were hashed hold plain "source:headline" IDs;
+                # hex digests never contain a colon
+                if ':' in news_id:
+                    news_id = hash_alert_id(news_id)
+                news_ids.add(news_id)
+        return frozenset(news_ids)
     except Exception as e:
         logger.error(f"Error loading alert history: {str(e)}")
-        return {'alerts_sent': [], 'last_check': None}
+        return frozenset()
+
+def ends_mid_line(path):
+    """Whether a file is non-empty and its last line is missing its newline"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return False
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b'\n'
 
-def save_alert_history(history):
-    """Save history of alerts that have been sent"""
+def append_alert_history(news_ids):
+    """Append newly alerted IDs to the alert history without rewriting it"""
+    if not news_ids:
+        return
+    
     try:
-        with open(ALERT_HISTORY_FILE, 'w') as f:
-            json.dump(history, f)
+        # Start on a fresh line if an earlier append was cut off mid-line
+        torn = ends_mid_line(ALERT_HISTORY_FILE)
+        with open(ALERT_HISTORY_FILE, 'a', buffering=1 << 16) as f:
+            if torn:
+                f.write('\n')
+            f.writelines(json.dumps(news_id) + '\n' for news_id in news_ids)
     except Exception as e:
         logger.error(f"Error saving alert history: {str(e)}")
 
-def is_critical_news(headline, content, source):
+def load_last_check():
+    """Load the time of the last alert check, or None if unknown"""
+    try:
+        if os.path.exists(ALERT_HISTORY_META_FILE):
+            with open(ALERT_HISTORY_META_FILE, 'r') as f:
+                return json.load(f).get('last_check')
+        return None
+    except Exception as e:
+        logger.error(f"Error loading last alert check time: {str(e)}")
+        return None
+
+def save_last_check(last_check):
+    """Save the time of the last alert check"""
+    try:
+        # Write to a temporary file and swap it in so a crash can't leave a half-written file
+        temp_file = ALERT_HISTORY_META_FILE + '.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump({'last_check': last_check}, f)
+        os.replace(temp_file, ALERT_HISTORY_META_FILE)
+    except Exception as e:
+        logger.error(f"Error saving last alert check time: {str(e)}")
+
+def is_critical_news(headline, content, source, combined_text=None):
     """
     Determine if a news item is critical based on keywords and source.
     Government sources like CERT-In and I4C are given more weight.
+    combined_text can be passed in when the lowercased headline and content
+    have already been computed for a whole DataFrame.
     """
-    # Keywords that suggest critical security news - grouped by severity
-    severity_high_keywords = [
-        'critical', 'urgent', 'emergency', 'severe', 'zero-day', 'zero day', 
-        'ransomware', 'remote code execution', 'data breach', 'national security'
-    ]
-    
-    severity_medium_keywords = [
-        'vulnerability', 'exploit', 'breach', 'attack', 'compromise', 'warning',
-        'malware', 'backdoor', 'data leak', 'hack', 'phishing campaign'
-    ]
-    
-    severity_low_keywords = [
-        'alert', 'security update', 'patch', 'advisory', 'update available',
-        'security issue', 'cybersecurity', 'threat'
-    ]
-    
-    # All keywords combined
-    all_critical_keywords = severity_high_keywords + severity_medium_keywords + severity_low_keywords
-    
-    # Sources to prioritize (government and authority sources)
-    priority_sources = ['CERT-In', 'NCIIPC', 'I4C', 'NASSCOM']
-    medium_priority_sources = ['The Economic Times', 'The Hindu', 'Times of India', 'India Today']
-    
     # Combined text for searching
-    combined_text = (headline + " " + content).lower()
-    
-    # Check for keywords by severity
-    high_matches = [keyword for keyword in severity_high_keywords if keyword.lower() in combined_text]
-    medium_matches = [keyword for keyword in severity_medium_keywords if keyword.lower() in combined_text]
-    low_matches = [keyword for keyword in severity_low_keywords if keyword.lower() in combined_text]
+    if combined_text is None:
+        combined_text = (headline + " " + content).lower()
     
-    # Count total matches across all severity levels
-    all_matches = high_matches + medium_matches + low_matches
+    # Collect every keyword present in a single pass over the text
+    found_keywords = {keyword for _, (_, keyword) in KEYWORD_AUTOMATON.iter(combined_text)}
     
     # Criteria for critical news (enhanced):
     # 1. Any news from high-priority sources with at least one high-severity keyword
     # 2. Any news from high-priority sources with at least two medium-severity keywords
-    # 3. Any news with at least one high-severity keyword AND one medium-severity keyword
-    # 4. Any news with at least three keywords of any severity
+    # 3. Any news from medium-priority sources with at least one high-severity keyword
+    # 4. Any news with at least one high-severity keyword AND one medium-severity keyword
+    # 5. Any news with at least three keywords of any severity
+    # Rules are checked in the cheapest order, and each severity list is only
+    # built once a rule actually needs it.
+    
+    if not found_keywords:
+        return False, ""
     
-    if source in priority_sources and len(high_matches) >= 1:
-        return True, f"High-priority source ({source}) with critical keyword: {high_matches[0]}"
+    high_matches = [keyword for keyword in SEVERITY_HIGH_KEYWORDS if keyword in found_keywords]
     
-    elif source in priority_sources and len(medium_matches) >= 2:
-        return True, f"High-priority source ({source}) with multiple medium-severity keywords: {', '.join(medium_matches[:2])}"
+    if high_matches:
+        if source in PRIORITY_SOURCES:
+            return True, f"High-priority source ({source}) with critical keyword: {high_matches[0]}"
+        if source in MEDIUM_PRIORITY_SOURCES:
+            return True, f"Medium-priority source ({source}) with high-severity keyword: {high_matches[0]}"
+    
+    medium_matches = [keyword for keyword in SEVERITY_MEDIUM_KEYWORDS if keyword in found_keywords]
     
-    elif source in medium_priority_sources and len(high_matches) >= 1:
-        return True, f"Medium-priority source ({source}) with high-severity keyword: {high_matches[0]}"
+    if source in PRIORITY_SOURCES and len(medium_matches) >= 2:
+        return True, f"High-priority source ({source}) with multiple medium-severity keywords: {', '.join(medium_matches[:2])}"
     
-    elif len(high_matches) >= 1 and len(medium_matches) >= 1:
+    if high_matches and medium_matches:
         return True, f"High and medium severity keywords: {high_matches[0]}, {medium_matches[0]}"
     
-    elif len(all_matches) >= 3:
+    # Every keyword belongs to exactly one severity, so the total is the number found
+    if len(found_keywords) >= 3:
+        low_matches = [keyword for keyword in SEVERITY_LOW_KEYWORDS if keyword in found_keywords]
+        all_matches = high_matches + medium_matches + low_matches
         return True, f"Multiple security keywords: {', '.join(all_matches[:3])}"
     
-    else:
-        return False, ""
+    return False, ""
+
+def critical_news_mask(news_df, combined_texts):
+    """
+    Vectorized version of the is_critical_news rules for a whole DataFrame.
+    Returns a boolean array marking the critical rows, computed from one
+    keyword hit matrix instead of checking the articles one by one.
+    """
+    hits = keyword_hit_matrix(combined_texts.tolist())
+    high_count = hits[:, HIGH_KEYWORD_COLUMNS].sum(axis=1)
+    medium_count = hits[:, MEDIUM_KEYWORD_COLUMNS].sum(axis=1)
+    total_count = hits.sum(axis=1)
+    
+    high_priority = news_df['source'].isin(list(PRIORITY_SOURCES)).to_numpy()
+    medium_priority = news_df['source'].isin(list(MEDIUM_PRIORITY_SOURCES)).to_numpy()
+    
+    return (
+        ((high_count > 0) & (high_priority | medium_priority)) |
+        (high_priority & (medium_count >= 2)) |
+        ((high_count > 0) & (medium_count > 0)) |
+        (total_count >= 3)
+    )
+
+def criticality_scores(news_df, combined_texts):
+    """
+    Score each news item by source priority plus keyword severity, returned as a
+    Series aligned with news_df. Keyword hits are a 0/1 matrix, so their scores
+    reduce to one matrix-vector product.
+    """
+    keyword_scores = keyword_hit_matrix(combined_texts.tolist()) @ KEYWORD_SCORE_VECTOR
+    return news_df['source'].map(SOURCE_PRIORITY_SCORES).fillna(0).astype(int) + keyword_scores
 
 def format_alert_message(news_item):
     """Format a news item into an SMS alert message"""
@@ -116,6 +393,12 @@ def format_alert_message(news_item):
     headline = news_item['headline']
     date = news_item['date']
     
+    # Processed dates are Timestamps; show only the day rather than a midnight time
+    try:
+        date = date.strftime('%Y-%m-%d')
+    except (AttributeError, ValueError):
+        pass
+    
     # Keep the message concise for SMS
     message = f"SECURITY ALERT: {source}\n\n{headline}\n\nDate: {date}"
     
@@ -125,6 +408,15 @@ def format_alert_message(news_item):
     
     return message
 
+def get_twilio_client():
+    """Return the shared Twilio client, creating it on first use"""
+    global twilio_client
+    
+    if twilio_client is None:
+        twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+    
+    return twilio_client
+
 def send_sms_alert(to_phone_number, message):
     """Send an SMS alert via Twilio"""
     if not all([TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_PHONE_NUMBER]):
@@ -132,7 +424,7 @@ def send_sms_alert(to_phone_number, message):
         return False
     
     try:
-        client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+        client = get_twilio_client()
         
         message = client.messages.create(
             body=message,
@@ -151,65 +443,85 @@ def check_for_alerts(news_df, phone_number=None):
     Check for critical security news items and send alerts if needed.
     Returns list of critical news items and alert sending status.
     """
-    if phone_number is None:
+    # Nothing to do without a recipient or news; skip the history I/O entirely
+    if not phone_number:
         logger.warning("No phone number provided for alerts")
         return [], False
+    
+    if news_df is None or news_df.empty:
+        logger.info("No news items to check for alerts")
+        return [], False
 
     # Load alert history to avoid duplicate alerts
-    history = load_alert_history()
-    already_alerted_ids = history.get('alerts_sent', [])
+    already_alerted_ids = set(load_alert_history())
     
     # Get the current time
     now = datetime.now()
     
     # Parse last check time if available
     last_check = None
-    if history.get('last_check'):
+    saved_last_check = load_last_check()
+    if saved_last_check:
         try:
-            last_check = datetime.fromisoformat(history['last_check'])
+            last_check = datetime.fromisoformat(saved_last_check)
         except (ValueError, TypeError):
             last_check = now - timedelta(days=1)  # Default to 1 day ago
     else:
         last_check = now - timedelta(days=1)  # Default to 1 day ago
     
-    # Update the last check time
-    history['last_check'] = now.isoformat()
+    # Create a unique ID for each news item to avoid duplicate alerts, and drop items
+    # we've already alerted about (or that repeat in this batch) before scanning them
+    news_ids = (news_df['source'].astype(str) + ":" + news_df['headline'].astype(str)).map(hash_alert_id)
+    unseen_mask = ~news_ids.isin(already_alerted_ids) & ~news_ids.duplicated()
+    news_df = news_df.loc[unseen_mask]
+    news_ids = news_ids.loc[unseen_mask]
     
-    # Check each news item for criticality
-    critical_items = []
-    alerts_sent = 0
+    # Lowercase all the text once instead of once per row
+    combined_texts = lowercase_news_text(news_df)
     
-    for _, row in news_df.iterrows():
-        # Create a unique ID for the news item to avoid duplicate alerts
-        news_id = f"{row['source']}:{row['headline']}"
-        
-        # Skip if we've already alerted about this item
-        if news_id in already_alerted_ids:
-            continue
-        
-        # Check if this is critical news
-        is_critical, reason = is_critical_news(row['headline'], row['content'], row['source'])
+    # Find the critical items for the whole frame at once, then only visit those rows
+    critical_mask = critical_news_mask(news_df, combined_texts)
+    news_df = news_df.loc[critical_mask]
+    news_ids = news_ids.loc[critical_mask]
+    combined_texts = combined_texts.loc[critical_mask]
+    
+    # Most severe first, so the digest lists the items that matter most before "+N more"
+    severity_order = np.argsort(-criticality_scores(news_df, combined_texts).to_numpy(), kind='stable')
+    news_df = news_df.iloc[severity_order]
+    news_ids = news_ids.iloc[severity_order]
+    combined_texts = combined_texts.iloc[severity_order]
+    
+    critical_items = []
+    pending_ids = []
+    new_alerted_ids = []
+    
+    for news_id, combined_text, row in zip(news_ids, combined_texts, news_df.itertuples(index=False)):
+        # Work out the reason for the log
+        _, reason = is_critical_news(row.headline, row.content, row.source, combined_text)
+        logger.info(f"Critical news detected: {row.headline} - {reason}")
+        critical_items.append(row._asdict())
+        pending_ids.append(news_id)
+    
+    # Send one SMS per check: a single item gets the full alert, several items
+    # are combined into one digest message instead of one message each
+    if phone_number and critical_items:
+        if len(critical_items) == 1:
+            success = send_sms_alert(phone_number, format_alert_message(critical_items[0]))
+        else:
+            success = send_digest_alert(phone_number, critical_items)
         
-        if is_critical:
-            logger.info(f"Critical news detected: {row['headline']} - {reason}")
-            critical_items.append(row.to_dict())
-            
-            # Send alert if phone number is provided
-            if phone_number:
-                message = format_alert_message(row.to_dict())
-                success = send_sms_alert(phone_number, message)
-                
-                if success:
-                    alerts_sent += 1
-                    # Add to history to avoid duplicate alerts
-                    already_alerted_ids.append(news_id)
-    
-    # Update history
-    history['alerts_sent'] = already_alerted_ids
-    save_alert_history(history)
+        if success:
+            # Add to history to avoid duplicate alerts
+            new_alerted_ids = pending_ids
+    
+    alerts_sent = len(new_alerted_ids)
+    
+    # Update history with the new alerts and the last check time
+    append_alert_history(new_alerted_ids)
+    save_last_check(now.isoformat())
     
     # Log results
-    logger.info(f"Alert check completed: {len(critical_items)} critical items found, {alerts_sent} alerts sent")
+    logger.info(f"Alert check completed: {len(critical_items)} critical items found, {alerts_sent} items alerted")
     
     return critical_items, alerts_sent > 0
 
@@ -226,7 +538,7 @@ def register_phone_for_alerts(phone_number):
         phone_number = '+' + phone_number
     
     # Remove any spaces or special characters except for the leading +
-    phone_number = '+' + ''.join(c for c in phone_number[1:] if c.isdigit())
+    phone_number = '+' + NON_DIGIT_PATTERN.sub('', phone_number[1:])
     
     # Validate phone number format (basic check)
     if len(phone_number) < 10:
@@ -287,86 +599,25 @@ def get_critical_news_digest(news_df=None, max_items=5):
     if news_df is None:
         # Load data if not provided
         try:
-            news_df = pd.read_csv('cybersecurity_news.csv')
+            news_df = load_news_data()
         except Exception as e:
             logger.error(f"Error loading news data: {str(e)}")
             return []
     
-    # List to store critical items with a score
-    scored_items = []
-    
-    # Priority sources
-    priority_sources = {
-        'CERT-In': 10, 
-        'NCIIPC': 9,
-        'I4C': 8,
-        'NASSCOM': 7,
-        'The Economic Times': 5,
-        'The Hindu': 5,
-        'Times of India': 5,
-        'India Today': 5
-    }
-    
-    # Severity keywords with scores
-    severity_scores = {
-        'critical': 10,
-        'urgent': 10,
-        'emergency': 10,
-        'severe': 9,
-        'zero-day': 9,
-        'zero day': 9,
-        'ransomware': 8,
-        'remote code execution': 8,
-        'data breach': 8,
-        'national security': 8,
-        'vulnerability': 7,
-        'exploit': 7,
-        'breach': 6,
-        'attack': 6,
-        'compromise': 6,
-        'warning': 5,
-        'malware': 5,
-        'backdoor': 5,
-        'data leak': 5,
-        'hack': 5,
-        'phishing campaign': 5,
-        'alert': 4,
-        'security update': 3,
-        'patch': 3,
-        'advisory': 3,
-        'update available': 2,
-        'security issue': 2,
-        'cybersecurity': 1,
-        'threat': 1
-    }
+    if news_df.empty:
+        return []
+    
+    # Lowercase headline and content for the whole frame at once
+    combined_text = lowercase_news_text(news_df)
     
     # Calculate a criticality score for each news item
-    for _, row in news_df.iterrows():
-        score = 0
-        headline = row['headline'].lower() if isinstance(row['headline'], str) else ""
-        content = row['content'].lower() if isinstance(row['content'], str) else ""
-        source = row['source']
-        
-        # Add source priority score
-        score += priority_sources.get(source, 0)
-        
-        # Add keyword severity scores
-        combined_text = headline + " " + content
-        for keyword, keyword_score in severity_scores.items():
-            if keyword.lower() in combined_text:
-                score += keyword_score
-        
-        # Only include items with a minimum score threshold (adjust as needed)
-        if score >= 10:
-            item_data = row.to_dict()
-            item_data['criticality_score'] = score
-            scored_items.append(item_data)
+    scores = criticality_scores(news_df, combined_text)
     
-    # Sort by criticality score (descending)
-    scored_items.sort(key=lambda x: x['criticality_score'], reverse=True)
+    # Only include items with a minimum score threshold (adjust as needed)
+    critical_df = news_df.loc[scores >= 10].assign(criticality_score=scores[scores >= 10])
     
-    # Return the top N items
-    return scored_items[:max_items]
+    # Return the top N items sorted by criticality score (descending)
+    return critical_df.nlargest(max_items, 'criticality_score').to_dict('records')
 
 def send_digest_alert(phone_number, digest_items):
     """
@@ -401,7 +652,7 @@ def run_alert_system(news_df=None):
     if news_df is None:
         # Load data if not provided
         try:
-            news_df = pd.read_csv('cybersecurity_news.csv')
+            news_df = load_news_data()
         except Exception as e:
             logger.error(f"Error loading news data: {str(e)}")
             return [], False
@@ -1,20 +1,25 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 import datetime
-import os
+import asyncio
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import json
 import numpy as np
 import re
-from scraper import scrape_all_sources, get_source_urls
+import html
+from scraper import scrape_all_sources_async, get_source_urls
 from data_processor import process_data, analyze_keywords, analyze_sentiment, generate_wordcloud, analyze_attack_types
-from visualizer import plot_news_by_source, plot_news_by_date, plot_sentiment_analysis, plot_keyword_distribution, plot_attack_types
-from utils import filter_dataframe, download_data, load_data, save_data
+from visualizer import plot_news_by_source, plot_news_by_date, plot_sentiment_analysis, plot_source_sentiment, plot_keyword_distribution, plot_attack_types
+from utils import filter_dataframe, download_data, load_data, save_data, data_file_exists, data_file_version, format_date
 from alert_system import (
     register_phone_for_alerts, get_registered_phone, test_alert_system, 
-    check_for_alerts, run_alert_system, get_critical_news_digest,
-    send_digest_alert
+    check_for_alerts, get_critical_news_digest,
+    send_digest_alert, SEVERITY_HIGH_KEYWORDS, SEVERITY_MEDIUM_KEYWORDS,
+    SEVERITY_LOW_KEYWORDS
 )
 
 # Set page configuration
@@ -24,304 +29,268 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize session state variables if they don't exist
-if 'data' not in st.session_state:
-    st.session_state.data = None
-if 'last_scraped' not in st.session_state:
-    st.session_state.last_scraped = None
-if 'keywords' not in st.session_state:
-    st.session_state.keywords = None
-if 'sentiment_data' not in st.session_state:
-    st.session_state.sentiment_data = None
-if 'attack_types' not in st.session_state:
-    st.session_state.attack_types = None
-if 'critical_alerts' not in st.session_state:
-    st.session_state.critical_alerts = []
-if 'alert_sent' not in st.session_state:
-    st.session_state.alert_sent = False
+# Number of articles shown in the Recent News Articles table by default
+RECENT_NEWS_ROWS = 500
 
-# Title
-st.title("🔒 Indian Cybersecurity News Tracker")
-st.subheader("Track, analyze, and visualize cybersecurity news from Indian sources")
+# Alert keywords with one column per severity (padded to equal length), built once so the
+# settings panel renders a single table instead of one element per keyword
+SEVERITY_KEYWORDS_TABLE = pd.DataFrame({
+    'High Severity': pd.Series(SEVERITY_HIGH_KEYWORDS),
+    'Medium Severity': pd.Series(SEVERITY_MEDIUM_KEYWORDS),
+    'Low Severity': pd.Series(SEVERITY_LOW_KEYWORDS)
+}).fillna('')
 
-# Sidebar
-st.sidebar.header("Controls")
+# Cached wrappers around the heavy processing/analysis steps, memoized by the (hashed) input
+# data. The caches are process-wide rather than tied to a script run, so the pipeline's worker
+# thread reuses the results when a scrape returns the same articles as an earlier one.
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_process_data(raw_data):
+    return process_data(raw_data)
 
-# Data loading and scraping options
-data_option = st.sidebar.radio(
-    "Choose data source:",
-    ("Load previous data", "Scrape new data")
-)
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_analyze_keywords(df):
+    return analyze_keywords(df)
 
-if data_option == "Load previous data":
-    if os.path.exists("cybersecurity_news.csv"):
-        st.session_state.data = load_data("cybersecurity_news.csv")
-        with st.sidebar.expander("Data loaded successfully"):
-            st.write(f"Loaded {len(st.session_state.data)} news articles")
-    else:
-        st.sidebar.warning("No previous data found. Please scrape new data.")
-        data_option = "Scrape new data"
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_analyze_sentiment(df):
+    return analyze_sentiment(df)
 
-if data_option == "Scrape new data":
-    scrape_button = st.sidebar.button("Start Scraping")
-    
-    if scrape_button:
-        # Create a progress container
-        progress_container = st.empty()
-        progress_container.info("Initializing scraping process...")
-        
-        source_urls = get_source_urls()
-        sources_text = "\n".join([f"- {src}" for src in source_urls.keys()])
-        st.info(f"Attempting to scrape from:\n{sources_text}")
-        
-        # Create a placeholder for scraping status
-        status_container = st.empty()
-        status_container.info("Starting to scrape sources...")
-        
-        # Perform scraping with detailed logging
-        raw_data = scrape_all_sources()
-        
-        # Show scraping results
-        if raw_data:
-            # Process the scraped data
-            progress_container.info("Processing scraped data...")
-            processed_data = process_data(raw_data)
-            
-            # Save and store the data
-            progress_container.info("Saving data...")
-            save_data(processed_data, "cybersecurity_news.csv")
-            st.session_state.data = processed_data
-            
-            # Calculate sources
-            sources = processed_data['source'].value_counts().to_dict()
-            
-            # Display results by source
-            result_text = "### Scraping Results\n"
-            for source, count in sources.items():
-                status = "✅" if count > 0 else "❌"
-                result_text += f"{status} **{source}**: {count} articles\n"
-            
-            status_container.markdown(result_text)
-            
-            # Record timestamp and run analysis
-            st.session_state.last_scraped = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Extract keywords, sentiment and attack types
-            progress_container.info("Analyzing keywords and sentiment...")
-            st.session_state.keywords = analyze_keywords(processed_data)
-            st.session_state.sentiment_data = analyze_sentiment(processed_data)
-            
-            progress_container.info("Analyzing attack types...")
-            st.session_state.attack_types = analyze_attack_types(processed_data)
-            
-            # Automatically check for critical security alerts and send notifications
-            registered_phone = get_registered_phone()
-            if registered_phone:
-                progress_container.info("Checking for critical security alerts...")
-                critical_items, alert_sent = run_alert_system(processed_data)
-                st.session_state.critical_alerts = critical_items
-                st.session_state.alert_sent = alert_sent
-                
-                if critical_items:
-                    if alert_sent:
-                        status_container.success(f"Found {len(critical_items)} critical security alerts. SMS notifications sent to {registered_phone}.")
-                    else:
-                        status_container.warning(f"Found {len(critical_items)} critical security alerts, but could not send SMS notifications. Check Twilio credentials.")
-            
-            # Show success message
-            progress_container.success(f"Scraping complete! Retrieved {len(processed_data)} articles from {len(sources)} sources.")
-            st.rerun()
-        else:
-            # Show error message
-            progress_container.error("No data retrieved from any source. Check the logs for details.")
-            status_container.markdown("### Scraping failed for all sources\nCheck each source for potential issues.")
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_analyze_attack_types(df):
+    return analyze_attack_types(df)
 
-# Main content area (only show if data is available)
-if st.session_state.data is not None:
-    df = st.session_state.data
+# Source of dataset versions, shared across sessions: the cached views keyed by a version are
+# process-wide, so two sessions' datasets must never get the same one
+@st.cache_resource
+def get_data_version_counter():
+    return itertools.count(1)
+
+# Worker threads for the scrape pipeline, shared across reruns and sessions
+@st.cache_resource
+def get_pipeline_executor():
+    return ThreadPoolExecutor(max_workers=2)
+
+def run_scrape_pipeline(progress, alert_phone):
+    """
+    Scrape all sources, then process, save and analyze the data and check it for alerts.
+    Runs in a worker thread, so it reports progress as messages on the `progress` queue
+    instead of calling Streamlit. Returns None if nothing could be scraped.
+    """
+    def report_source_done(source_name, item_count):
+        progress.put(f"{source_name}: {item_count} articles")
     
-    # Data info section
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total News Articles", len(df))
-    with col2:
-        st.metric("Sources", df['source'].nunique())
-    with col3:
-        if st.session_state.last_scraped:
-            st.metric("Last Updated", st.session_state.last_scraped)
+    progress.put("Scraping sources...")
+    raw_data = asyncio.run(scrape_all_sources_async(report_source_done))
+    if not raw_data:
+        return None
     
-    # Filter section
-    with st.expander("Filter Data", expanded=True):
-        col1, col2 = st.columns(2)
-        with col1:
-            selected_sources = st.multiselect(
-                "Select Sources",
-                options=sorted(df['source'].unique()),
-                default=sorted(df['source'].unique())
-            )
-        with col2:
-            # Ensure dates are proper datetime dates for the date_input widget
-            min_date = df['date'].min().date() if isinstance(df['date'].min(), pd.Timestamp) else df['date'].min()
-            max_date = df['date'].max().date() if isinstance(df['date'].max(), pd.Timestamp) else df['date'].max()
-            
-            date_range = st.date_input(
-                "Select Date Range",
-                [min_date, max_date],
-                min_value=min_date,
-                max_value=max_date
-            )
-        
-        search_term = st.text_input("Search in Headlines", "")
-        
-        # Apply filters
-        filtered_df = filter_dataframe(df, selected_sources, date_range, search_term)
-        
-        st.write(f"Showing {len(filtered_df)} of {len(df)} articles")
+    progress.put("Processing scraped data...")
+    processed_data = cached_process_data(raw_data)
     
-    # Display filtered data
-    st.subheader("Recent News Articles")
-    st.dataframe(
-        filtered_df[['headline', 'source', 'date', 'url']].sort_values('date', ascending=False),
-        use_container_width=True,
-        hide_index=True
-    )
+    progress.put("Saving data...")
+    save_data(processed_data)
     
-    # Download option
-    download_data(filtered_df, "indian_cybersecurity_news.csv")
+    progress.put("Analyzing keywords and sentiment...")
+    keywords = cached_analyze_keywords(processed_data)
+    sentiment_data = cached_analyze_sentiment(processed_data)
     
-    # Visualizations
-    st.header("Visualizations and Insights")
+    progress.put("Analyzing attack types...")
+    attack_types = cached_analyze_attack_types(processed_data)
     
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Source Distribution", "Time Trends", "Sentiment Analysis", "Keyword Analysis", "Attack Types"])
+    # Automatically check for critical security alerts and send notifications
+    critical_items, alert_sent = None, False
+    if alert_phone:
+        progress.put("Checking for critical security alerts...")
+        critical_items, alert_sent = check_for_alerts(processed_data, alert_phone)
     
-    with tab1:
-        st.subheader("News Distribution by Source")
-        fig = plot_news_by_source(filtered_df)
+    return {
+        'data': processed_data,
+        'keywords': keywords,
+        'sentiment_data': sentiment_data,
+        'attack_types': attack_types,
+        'critical_items': critical_items,
+        'alert_sent': alert_sent
+    }
+
+# Attack type analysis of a filtered view, keyed by the dataset version (the analysis reads the
+# article text, which can change under the same headlines) plus the headlines it covers, so each
+# filter set is analyzed once without rehashing all of the article text
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_analyze_filtered_attack_types(data_version, headlines_key, _df):
+    return analyze_attack_types(_df)
+
+# Filter results keyed by the dataset version plus the filter settings (sources as a sorted
+# tuple so the key doesn't depend on selection order); the data itself is passed unhashed so
+# reruns don't rehash all of its article text. The text is also left out of the result so the
+# filtered frame copied out of the cache on every rerun stays small; with_content() brings it
+# back on demand.
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_filter_dataframe(data_version, _df, sources_key, date_range, search_term):
+    return filter_dataframe(_df, list(sources_key), date_range, search_term).drop(columns=['content'], errors='ignore')
+
+def filtered_headlines_key(filtered_df):
+    """Cache key identifying the articles in a filtered view, independent of their order"""
+    return tuple(sorted(filtered_df['headline'].tolist()))
+
+def with_content(filtered_df):
+    """Look up the full rows (including article text) for a filtered view, only where it's needed"""
+    return st.session_state.data.loc[filtered_df.index]
+
+# The word cloud is keyed by the dataset version (it is built from the article text, which can
+# change under the same headlines) and the headlines it covers; the DataFrame itself is passed
+# as an unhashed argument so switching tabs doesn't rehash all of its content
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_wordcloud(data_version, headlines_key, _df):
+    return generate_wordcloud(_df)
+
+# The registered phone number is read from disk once per session instead of at every
+# call site on every rerun; registering a new number clears it
+def cached_registered_phone():
+    if 'registered_phone' not in st.session_state:
+        st.session_state.registered_phone = get_registered_phone()
+    return st.session_state.registered_phone
+
+# Cached chart builders, keyed by the (hashed) data they plot, so reruns that don't change
+# a chart's data (tab switches, unrelated widgets) reuse the already built figure
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_plot_news_by_source(df):
+    return plot_news_by_source(df)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_plot_news_by_date(df):
+    return plot_news_by_date(df)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_plot_sentiment_analysis(sentiment_df):
+    return plot_sentiment_analysis(sentiment_df)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_plot_source_sentiment(sentiment_df):
+    return plot_source_sentiment(sentiment_df)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_plot_keyword_distribution(keyword_counts):
+    return plot_keyword_distribution(keyword_counts)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_plot_attack_types(attack_df):
+    return plot_attack_types(attack_df)
+
+# Filter widget options and the date-sorted display table, built once per dataset version
+# instead of re-scanning and re-sorting (or rehashing) the data on every rerun
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_filter_index(data_version, _df):
+    min_date = _df['date'].min()
+    max_date = _df['date'].max()
+    return {
+        'sources': sorted(_df['source'].unique()),
+        'min_date': min_date.date() if isinstance(min_date, pd.Timestamp) else min_date,
+        'max_date': max_date.date() if isinstance(max_date, pd.Timestamp) else max_date,
+        'sorted_view': _df[['headline', 'source', 'date', 'url']].sort_values('date', ascending=False)
+    }
+
+# Each tab is rendered as a fragment so its own widget interactions only rerun that tab
+# instead of the whole script (and every other tab's charts)
+@st.fragment
+def render_source_tab(filtered_df):
+    st.subheader("News Distribution by Source")
+    fig = cached_plot_news_by_source(filtered_df)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def render_time_trends_tab(filtered_df):
+    st.subheader("News Trends Over Time")
+    fig = cached_plot_news_by_date(filtered_df)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def render_sentiment_tab(filtered_df):
+    st.subheader("Sentiment Analysis")
+    if st.session_state.sentiment_data is not None:
+        # Filter sentiment data
+        filtered_sentiment = st.session_state.sentiment_data.reindex(
+            filtered_df['headline'].drop_duplicates()
+        ).dropna(subset=['polarity'])
+        fig = cached_plot_sentiment_analysis(filtered_sentiment)
         st.plotly_chart(fig, use_container_width=True)
-    
-    with tab2:
-        st.subheader("News Trends Over Time")
-        fig = plot_news_by_date(filtered_df)
+
+        # Display average sentiment by source
+        st.subheader("Average Sentiment by Source")
+        fig = cached_plot_source_sentiment(filtered_sentiment)
         st.plotly_chart(fig, use_container_width=True)
-    
-    with tab3:
-        st.subheader("Sentiment Analysis")
-        if st.session_state.sentiment_data is not None:
-            # Filter sentiment data
-            filtered_sentiment = st.session_state.sentiment_data[
-                st.session_state.sentiment_data['headline'].isin(filtered_df['headline'])
-            ]
-            fig = plot_sentiment_analysis(filtered_sentiment)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Display average sentiment by source
-            st.subheader("Average Sentiment by Source")
-            source_sentiment = filtered_sentiment.groupby('source')['polarity'].mean().reset_index()
-            source_sentiment = source_sentiment.rename(columns={'polarity': 'sentiment_score'})
-            fig = px.bar(
-                source_sentiment, 
-                x='source', 
-                y='sentiment_score',
-                color='sentiment_score',
-                color_continuous_scale=['red', 'yellow', 'green'],
-                title="Average Sentiment Score by Source",
-                labels={'sentiment_score': 'Sentiment Score (-1 to 1)'}
+    else:
+        st.info("Sentiment data not available. Please run sentiment analysis.")
+
+@st.fragment
+def render_keyword_tab(filtered_df):
+    st.subheader("Keyword Analysis")
+    if st.session_state.keywords is not None:
+        # Get top keywords
+        keyword_counts = st.session_state.keywords
+        fig = cached_plot_keyword_distribution(keyword_counts)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Generate word cloud
+        st.subheader("Word Cloud of Key Terms")
+        wc_image = cached_wordcloud(
+            st.session_state.data_version, filtered_headlines_key(filtered_df), with_content(filtered_df)
+        )
+        st.image(wc_image)
+    else:
+        st.info("Keyword data not available. Please run keyword analysis.")
+
+@st.fragment
+def render_attack_types_tab(filtered_df):
+    st.subheader("Cyber Attack Types Analysis")
+    if st.session_state.attack_types is not None:
+        # Get attack type analysis
+        st.write("This visualization shows the distribution of cyber attack types mentioned in news articles.")
+
+        # If we need to reanalyze for the filtered dataset
+        if st.checkbox("Analyze attack types in filtered dataset only", value=False):
+            st.info("Analyzing attack types in filtered data...")
+            filtered_attack_df = cached_analyze_filtered_attack_types(
+                st.session_state.data_version, filtered_headlines_key(filtered_df), with_content(filtered_df)
             )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Sentiment data not available. Please run sentiment analysis.")
-    
-    with tab4:
-        st.subheader("Keyword Analysis")
-        if st.session_state.keywords is not None:
-            # Get top keywords
-            keyword_counts = st.session_state.keywords
-            fig = plot_keyword_distribution(keyword_counts)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Generate word cloud
-            st.subheader("Word Cloud of Key Terms")
-            wc_image = generate_wordcloud(filtered_df)
-            st.image(wc_image)
+            fig = cached_plot_attack_types(filtered_attack_df)
         else:
-            st.info("Keyword data not available. Please run keyword analysis.")
-    
-    with tab5:
-        st.subheader("Cyber Attack Types Analysis")
-        if st.session_state.attack_types is not None:
-            # Get attack type analysis
-            st.write("This visualization shows the distribution of cyber attack types mentioned in news articles.")
-            
-            # If we need to reanalyze for the filtered dataset
-            if st.checkbox("Analyze attack types in filtered dataset only", value=False):
-                st.info("Analyzing attack types in filtered data...")
-                filtered_attack_df = analyze_attack_types(filtered_df)
-                fig = plot_attack_types(filtered_attack_df)
-            else:
-                # Use the pre-analyzed attack types
-                fig = plot_attack_types(st.session_state.attack_types)
-                
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Add some insights about attack types
-            st.subheader("Attack Type Insights")
-            
-            if len(st.session_state.attack_types) > 0:
-                top_attack = st.session_state.attack_types.iloc[0]['attack_type']
-                top_attack_count = st.session_state.attack_types.iloc[0]['count']
-                
-                st.markdown(f"""
-                #### Key Findings:
-                - **Most common attack type:** {top_attack} ({top_attack_count} mentions)
-                - **Total attack types identified:** {len(st.session_state.attack_types)}
-                
-                These insights can help organizations prioritize their cybersecurity defenses based on the most prevalent threats in the news.
-                """)
-            else:
-                st.info("No attack types detected in the dataset.")
-        else:
-            st.info("Attack type data not available. Please scrape new data to analyze attack types.")
+            # Use the pre-analyzed attack types
+            fig = cached_plot_attack_types(st.session_state.attack_types)
 
-    # Article details view
-    if len(filtered_df) > 0:
-        st.header("Article Details")
-        selected_article = st.selectbox(
-            "Select an article to view details",
-            filtered_df['headline'].tolist()
-        )
-        
-        if selected_article:
-            article = filtered_df[filtered_df['headline'] == selected_article].iloc[0]
-            
-            st.subheader(article['headline'])
-            st.write(f"**Source:** {article['source']} | **Date:** {article['date'].strftime('%Y-%m-%d')}")
-            
-            if 'content' in article and article['content']:
-                st.write("**Summary:**")
-                st.write(article['content'][:500] + "..." if len(article['content']) > 500 else article['content'])
-            
-            st.write(f"[Read Full Article]({article['url']})")
-else:
-    st.info("No data available. Please load previous data or scrape new data using the sidebar options.")
+        st.plotly_chart(fig, use_container_width=True)
 
-# Security Alert System
-st.header("🚨 Critical Security Alerts")
+        # Add some insights about attack types
+        st.subheader("Attack Type Insights")
 
-# Create a tab layout for the alert system
-alert_tab1, alert_tab2 = st.tabs(["Alert Setup", "Critical News"])
+        if len(st.session_state.attack_types) > 0:
+            top_attack = st.session_state.attack_types.iloc[0]['attack_type']
+            top_attack_count = st.session_state.attack_types.iloc[0]['count']
 
-with alert_tab1:
+            st.markdown(f"""
+            #### Key Findings:
+            - **Most common attack type:** {top_attack} ({top_attack_count} mentions)
+            - **Total attack types identified:** {len(st.session_state.attack_types)}
+
+            These insights can help organizations prioritize their cybersecurity defenses based on the most prevalent threats in the news.
+            """)
+        else:
+            st.info("No attack types detected in the dataset.")
+    else:
+        st.info("Attack type data not available. Please scrape new data to analyze attack types.")
+
+@st.fragment
+def render_alert_setup_tab():
     st.subheader("Register for SMS Alerts")
     st.write("""
     Get instant SMS notifications for critical cybersecurity alerts from government sources.
     This feature uses Twilio to send SMS messages to your registered phone number.
     """)
-    
+
     # Show currently registered phone (if any)
-    current_phone = get_registered_phone()
+    current_phone = cached_registered_phone()
     if current_phone:
         st.success(f"Currently registered phone number: {current_phone}")
-    
+
     # Phone number registration
     with st.form("phone_registration_form"):
         phone_number = st.text_input(
@@ -329,19 +298,21 @@ with alert_tab1:
             placeholder="+91XXXXXXXXXX",
             help="Include your country code (e.g., +91 for India)"
         )
-        
+
         col1, col2 = st.columns(2)
         register_submitted = col1.form_submit_button("Register Phone")
         test_submitted = col2.form_submit_button("Test Alert")
-    
+
     # Handle form submission for registration
     if register_submitted and phone_number:
         success, message = register_phone_for_alerts(phone_number)
         if success:
+            # Re-read the newly registered number on next access
+            st.session_state.pop('registered_phone', None)
             st.success(message)
         else:
             st.error(message)
-    
+
     # Handle form submission for test alert
     if test_submitted:
         phone_to_test = current_phone or phone_number
@@ -354,7 +325,7 @@ with alert_tab1:
                     st.error(message)
         else:
             st.error("No phone number provided for testing")
-    
+
     # Alert settings
     st.subheader("Alert Settings")
     with st.expander("Configure Alert Settings", expanded=False):
@@ -366,65 +337,40 @@ with alert_tab1:
         - Any news with combinations of high and medium severity keywords
         - Any news with multiple security-related keywords (3+)
         """)
-        
+
         # Show the keywords that trigger alerts by severity
         st.write("#### Critical Keywords by Severity:")
-        
-        st.write("**High Severity:**")
-        high_cols = st.columns(3)
-        high_keywords = [
-            'critical', 'urgent', 'emergency', 'severe', 'zero-day', 
-            'ransomware', 'remote code execution', 'data breach', 'national security'
-        ]
-        for i, keyword in enumerate(high_keywords):
-            high_cols[i % 3].markdown(f"- {keyword}")
-        
-        st.write("**Medium Severity:**")
-        med_cols = st.columns(3)
-        medium_keywords = [
-            'vulnerability', 'exploit', 'breach', 'attack', 'compromise', 'warning',
-            'malware', 'backdoor', 'data leak', 'hack', 'phishing campaign'
-        ]
-        for i, keyword in enumerate(medium_keywords):
-            med_cols[i % 3].markdown(f"- {keyword}")
-            
-        st.write("**Low Severity:**")
-        low_cols = st.columns(3)
-        low_keywords = [
-            'alert', 'security update', 'patch', 'advisory', 'update available',
-            'security issue', 'cybersecurity', 'threat'
-        ]
-        for i, keyword in enumerate(low_keywords):
-            low_cols[i % 3].markdown(f"- {keyword}")
-            
+        st.dataframe(SEVERITY_KEYWORDS_TABLE, hide_index=True, use_container_width=True)
+
         # Add auto-alert explanation
         st.write("""
         #### Automatic Alert System
-        
+
         When new data is scraped, the system:
         1. Automatically analyzes all new articles for critical security issues
         2. Identifies high-priority news items using the criteria above
-        3. Immediately sends SMS alerts for critical news to your registered phone
+        3. Sends one SMS covering the new critical news to your registered phone
         4. Saves alert history to prevent duplicate notifications
         """)
-        
-        if not get_registered_phone():
+
+        if not cached_registered_phone():
             st.warning("⚠️ No phone number registered. Please register a phone number above to receive automatic alerts.")
 
-with alert_tab2:
+@st.fragment
+def render_critical_news_tab():
     st.subheader("Critical Security News")
-    
+
     # Create columns for the two button options
     col1, col2 = st.columns(2)
-    
+
     # Button to check for critical alerts
     if col1.button("Check for Critical Alerts Now"):
         if st.session_state.data is not None:
             with st.spinner("Analyzing news for critical security threats..."):
-                critical_items, alert_sent = check_for_alerts(st.session_state.data, get_registered_phone())
+                critical_items, alert_sent = check_for_alerts(st.session_state.data, cached_registered_phone())
                 st.session_state.critical_alerts = critical_items
                 st.session_state.alert_sent = alert_sent
-                
+
                 if critical_items:
                     if alert_sent:
                         st.success(f"Found {len(critical_items)} critical security alerts. SMS notifications sent.")
@@ -434,16 +380,16 @@ with alert_tab2:
                     st.info("No critical security alerts found in the current data.")
         else:
             st.error("No data available. Please load or scrape news data first.")
-    
+
     # Button for sending a security digest
     if col2.button("Send Security Digest"):
         if st.session_state.data is not None:
             with st.spinner("Generating security digest..."):
-                phone_number = get_registered_phone()
+                phone_number = cached_registered_phone()
                 if phone_number:
                     # Get the top critical news items by score
                     digest_items = get_critical_news_digest(st.session_state.data, max_items=5)
-                    
+
                     if digest_items:
                         # Send the digest
                         success = send_digest_alert(phone_number, digest_items)
@@ -451,7 +397,7 @@ with alert_tab2:
                             st.success(f"Security digest with top {len(digest_items)} critical items sent to {phone_number}")
                         else:
                             st.error("Failed to send security digest. Check Twilio credentials.")
-                        
+
                         # Store in session state to display
                         st.session_state.critical_alerts = digest_items
                     else:
@@ -460,55 +406,326 @@ with alert_tab2:
                     st.error("No phone number registered for alerts. Please register a phone number first.")
         else:
             st.error("No data available. Please load or scrape news data first.")
-    
+
     # Display critical alerts with severity scores
     if st.session_state.critical_alerts:
         st.write(f"Found {len(st.session_state.critical_alerts)} critical security alerts:")
-        
-        # Sort by criticality score if available
-        sorted_items = st.session_state.critical_alerts
-        if 'criticality_score' in sorted_items[0]:
-            sorted_items = sorted(sorted_items, key=lambda x: x.get('criticality_score', 0), reverse=True)
-        
-        for i, item in enumerate(sorted_items):
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f"**{i+1}. {item['headline']}**")
-                    score_text = f" | Severity: {item['criticality_score']}" if 'criticality_score' in item else ""
-                    st.markdown(f"Source: **{item['source']}** | Date: {item['date']}{score_text}")
-                    
-                with col2:
-                    if 'url' in item and item['url']:
-                        st.markdown(f"[Read Full Article]({item['url']})")
-                
-                # Show a preview of the content
-                if 'content' in item and item['content']:
-                    with st.expander("Show details"):
-                        st.write(item['content'][:300] + "..." if len(item['content']) > 300 else item['content'])
-                
-                st.divider()
+
+        # Sort by criticality score if available, as one vectorized sort over a DataFrame
+        alerts_df = pd.DataFrame(st.session_state.critical_alerts)
+        has_score = 'criticality_score' in alerts_df.columns
+        if has_score:
+            alerts_df = alerts_df.sort_values('criticality_score', ascending=False, kind='stable')
+
+        # Render every alert in a single markdown element instead of several elements per alert
+        alert_blocks = []
+        for i, item in enumerate(alerts_df.itertuples(index=False)):
+            score_text = f" | Severity: {item.criticality_score}" if has_score else ""
+            url = getattr(item, 'url', None)
+            link_text = f' | <a href="{html.escape(str(url))}" target="_blank">Read Full Article</a>' if url and pd.notna(url) else ""
+            alert_blocks.append(
+                f"<div><b>{i+1}. {html.escape(str(item.headline))}</b><br>"
+                f"Source: <b>{html.escape(str(item.source))}</b> | Date: {format_date(item.date)}{score_text}{link_text}</div>"
+            )
+        st.markdown("<hr>".join(alert_blocks), unsafe_allow_html=True)
+
+        # Show the content preview of one selected alert
+        if 'content' in alerts_df.columns:
+            has_content = alerts_df['content'].fillna('').astype(str).str.len() > 0
+            if has_content.any():
+                selected_alert = st.selectbox(
+                    "Show details for",
+                    alerts_df.index[has_content].tolist(),
+                    format_func=lambda index: alerts_df.at[index, 'headline']
+                )
+                content = str(alerts_df.at[selected_alert, 'content'])
+                st.write(content[:300] + "..." if len(content) > 300 else content)
     else:
         st.info("No critical security alerts detected. Check back after scraping new data or click one of the buttons above to check current data.")
-    
+
     # Add explanation about the difference between regular alerts and digest
     with st.expander("About Security Alerts vs. Security Digest"):
         st.write("""
         ### Alert Types
-        
+
         **Individual Alerts** (Check for Critical Alerts Now):
         - Checks for critical items using keyword and source-based criteria
-        - Sends individual SMS notifications for each critical item
+        - Sends one SMS per check: the full alert for a single item, or a short digest for several
         - Good for immediate notification about specific security issues
-        
+
         **Security Digest** (Send Security Digest):
         - Uses a scoring system to rank news items by criticality
         - Combines the top items into a single SMS message
         - Useful for getting a summary of the most important security news
-        
+
         Both options will only send alerts to your registered phone number.
         """)
 
+# Initialize session state variables if they don't exist
+if 'data' not in st.session_state:
+    st.session_state.data = None
+if 'last_scraped' not in st.session_state:
+    st.session_state.last_scraped = None
+if 'keywords' not in st.session_state:
+    st.session_state.keywords = None
+if 'sentiment_data' not in st.session_state:
+    st.session_state.sentiment_data = None
+if 'attack_types' not in st.session_state:
+    st.session_state.attack_types = None
+if 'critical_alerts' not in st.session_state:
+    st.session_state.critical_alerts = []
+if 'alert_sent' not in st.session_state:
+    st.session_state.alert_sent = False
+# Changed whenever the data is replaced, so cached views of it can be keyed by this version
+# instead of hashing the whole DataFrame on every rerun
+if 'data_version' not in st.session_state:
+    st.session_state.data_version = 0
+if 'loaded_file_version' not in st.session_state:
+    st.session_state.loaded_file_version = None
+
+def set_data(df, file_version=None):
+    """Replace the current data, recording the saved-file version it was loaded from (if any)"""
+    st.session_state.data = df
+    st.session_state.data_version = next(get_data_version_counter())
+    st.session_state.loaded_file_version = file_version
+
+# Title
+st.title("🔒 Indian Cybersecurity News Tracker")
+st.subheader("Track, analyze, and visualize cybersecurity news from Indian sources")
+
+# Sidebar
+st.sidebar.header("Controls")
+
+# Data loading and scraping options
+data_option = st.sidebar.radio(
+    "Choose data source:",
+    ("Load previous data", "Scrape new data")
+)
+
+if data_option == "Load previous data":
+    if data_file_exists():
+        # Only read the file again when it changed since it was loaded
+        file_version = data_file_version()
+        if st.session_state.data is None or st.session_state.loaded_file_version != file_version:
+            set_data(load_data(), file_version)
+        with st.sidebar.expander("Data loaded successfully"):
+            st.write(f"Loaded {len(st.session_state.data)} news articles")
+    else:
+        st.sidebar.warning("No previous data found. Please scrape new data.")
+        data_option = "Scrape new data"
+
+if data_option == "Scrape new data":
+    scrape_button = st.sidebar.button("Start Scraping")
+    
+    # Start the scrape pipeline in a worker thread (unless one is already running)
+    if scrape_button and 'scrape_job' not in st.session_state:
+        source_urls = get_source_urls()
+        sources_text = "\n".join([f"- {src}" for src in source_urls.keys()])
+        st.info(f"Attempting to scrape from:\n{sources_text}")
+        
+        progress = queue.Queue()
+        future = get_pipeline_executor().submit(run_scrape_pipeline, progress, cached_registered_phone())
+        st.session_state.scrape_job = (future, progress)
+
+# Follow a running scrape job, even across reruns triggered while it is in progress
+if 'scrape_job' in st.session_state:
+    future, progress = st.session_state.scrape_job
+    
+    # Create a placeholder for scraping status
+    status_container = st.empty()
+    
+    with st.status("Scraping sources...", expanded=True) as scrape_status:
+        while True:
+            finished = future.done()
+            
+            # Show the progress messages posted by the worker since the last poll
+            while not progress.empty():
+                message = progress.get_nowait()
+                scrape_status.update(label=message)
+                scrape_status.write(message)
+            
+            if finished:
+                break
+            time.sleep(0.5)
+        
+        del st.session_state.scrape_job
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            result = None
+            scrape_status.update(label=f"Scraping failed: {str(e)}", state="error")
+    
+    # Show scraping results
+    if result:
+        processed_data = result['data']
+        set_data(processed_data)
+        
+        # Calculate sources (sorted by article count)
+        sources = processed_data['source'].value_counts()
+        
+        # Display results by source
+        result_text = "### Scraping Results\n" + "\n".join(
+            f"{'✅' if count > 0 else '❌'} **{source}**: {count} articles"
+            for source, count in sources.items()
+        )
+        
+        status_container.markdown(result_text)
+        
+        # Record timestamp and analysis results
+        st.session_state.last_scraped = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        st.session_state.keywords = result['keywords']
+        sentiment_data = result['sentiment_data'].astype({'polarity': 'float32', 'source': 'category'})
+        # Index by headline once so the Sentiment tab can filter with an index lookup
+        st.session_state.sentiment_data = sentiment_data.drop_duplicates('headline').set_index('headline', drop=False)
+        st.session_state.attack_types = result['attack_types']
+        
+        if result['critical_items'] is not None:
+            critical_items = result['critical_items']
+            st.session_state.critical_alerts = critical_items
+            st.session_state.alert_sent = result['alert_sent']
+            
+            if critical_items:
+                if result['alert_sent']:
+                    status_container.success(f"Found {len(critical_items)} critical security alerts. SMS notifications sent to {cached_registered_phone()}.")
+                else:
+                    status_container.warning(f"Found {len(critical_items)} critical security alerts, but could not send SMS notifications. Check Twilio credentials.")
+        
+        # Show success message
+        scrape_status.update(label=f"Scraping complete! Retrieved {len(processed_data)} articles from {len(sources)} sources.", state="complete", expanded=False)
+        st.rerun()
+    elif future.exception() is None:
+        # Show error message
+        scrape_status.update(label="No data retrieved from any source. Check the logs for details.", state="error")
+        status_container.markdown("### Scraping failed for all sources\nCheck each source for potential issues.")
+
+# Main content area (only show if data is available)
+if st.session_state.data is not None:
+    df = st.session_state.data
+    filter_index = cached_filter_index(st.session_state.data_version, df)
+    
+    # Data info section
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total News Articles", len(df))
+    with col2:
+        st.metric("Sources", len(filter_index['sources']))
+    with col3:
+        if st.session_state.last_scraped:
+            st.metric("Last Updated", st.session_state.last_scraped)
+    
+    # Filter section
+    with st.expander("Filter Data", expanded=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_sources = st.multiselect(
+                "Select Sources",
+                options=filter_index['sources'],
+                default=filter_index['sources']
+            )
+        with col2:
+            # Dates are already converted to proper datetime dates for the date_input widget
+            min_date = filter_index['min_date']
+            max_date = filter_index['max_date']
+            
+            date_range = st.date_input(
+                "Select Date Range",
+                [min_date, max_date],
+                min_value=min_date,
+                max_value=max_date
+            )
+        
+        search_term = st.text_input("Search in Headlines", "")
+        
+        # Apply filters
+        filtered_df = cached_filter_dataframe(
+            st.session_state.data_version, df, tuple(sorted(selected_sources)), tuple(date_range), search_term
+        )
+        
+        st.write(f"Showing {len(filtered_df)} of {len(df)} articles")
+    
+    # Display filtered data
+    st.subheader("Recent News Articles")
+    # Select the filtered rows from the pre-sorted view (keeps its order, no re-sort)
+    sorted_view = filter_index['sorted_view']
+    recent_news = sorted_view[sorted_view.index.isin(filtered_df.index)]
+    
+    # Only send the most recent rows to the browser unless the user asks for all of them
+    if len(recent_news) > RECENT_NEWS_ROWS:
+        if not st.toggle(f"Show all {len(recent_news)} articles", value=False):
+            recent_news = recent_news.head(RECENT_NEWS_ROWS)
+    
+    st.dataframe(
+        recent_news,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'headline': st.column_config.TextColumn("Headline"),
+            'source': st.column_config.TextColumn("Source"),
+            'date': st.column_config.DateColumn("Date"),
+            'url': st.column_config.LinkColumn("Link")
+        }
+    )
+    
+    # Download option
+    download_data(with_content(filtered_df), "indian_cybersecurity_news.csv")
+    
+    # Visualizations
+    st.header("Visualizations and Insights")
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Source Distribution", "Time Trends", "Sentiment Analysis", "Keyword Analysis", "Attack Types"])
+    
+    with tab1:
+        render_source_tab(filtered_df)
+    
+    with tab2:
+        render_time_trends_tab(filtered_df)
+    
+    with tab3:
+        render_sentiment_tab(filtered_df)
+    
+    with tab4:
+        render_keyword_tab(filtered_df)
+    
+    with tab5:
+        render_attack_types_tab(filtered_df)
+
+    # Article details view
+    if len(filtered_df) > 0:
+        st.header("Article Details")
+        selected_article = st.selectbox(
+            "Select an article to view details",
+            filtered_df['headline'].tolist()
+        )
+        
+        if selected_article:
+            article = filtered_df[filtered_df['headline'] == selected_article].iloc[0]
+            
+            st.subheader(article['headline'])
+            st.write(f"**Source:** {article['source']} | **Date:** {article['date'].strftime('%Y-%m-%d')}")
+            
+            # The filtered view has no article text, so fetch just this article's
+            content = df.at[article.name, 'content'] if 'content' in df.columns else None
+            if content and pd.notna(content):
+                st.write("**Summary:**")
+                st.write(content[:500] + "..." if len(content) > 500 else content)
+            
+            st.write(f"[Read Full Article]({article['url']})")
+else:
+    st.info("No data available. Please load previous data or scrape new data using the sidebar options.")
+
+# Security Alert System
+st.header("🚨 Critical Security Alerts")
+
+# Create a tab layout for the alert system
+alert_tab1, alert_tab2 = st.tabs(["Alert Setup", "Critical News"])
+
+with alert_tab1:
+    render_alert_setup_tab()
+
+with alert_tab2:
+    render_critical_news_tab()
+
 # Footer
 st.markdown("---")
 st.markdown(
@@ -1,15 +1,18 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import datetime
 import re
 from collections import Counter
+from functools import lru_cache
+from joblib import Parallel, delayed
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.probability import FreqDist
 from nltk.stem import WordNetLemmatizer
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
 from textblob import TextBlob
-import matplotlib.pyplot as plt
+from PIL import Image, ImageDraw, ImageFont
 from wordcloud import WordCloud
 import io
 import base64
@@ -19,26 +22,39 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Download NLTK resources
+# pyahocorasick provides the fast keyword scanner; fall back to plain substring checks without it
 try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
-    
-    # Create nltk_data directory if it doesn't exist
-    import os
-    nltk_data_dir = os.path.expanduser('~/nltk_data')
-    if not os.path.exists(nltk_data_dir):
-        os.makedirs(nltk_data_dir)
-    
-    # Make sure punkt is properly downloaded
-    if not nltk.data.find('tokenizers/punkt'):
-        nltk.download('punkt', download_dir=nltk_data_dir)
-    
-    # Verify downloads
-    logger.info("NLTK resources downloaded successfully")
-except Exception as e:
-    logger.warning(f"Error downloading NLTK resources: {str(e)}")
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# NLTK resources used by this module, with the paths nltk.data.find looks them up by
+NLTK_RESOURCES = {
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'vader_lexicon': 'sentiment/vader_lexicon.zip',
+}
+
+def ensure_nltk_resources():
+    """Download the NLTK resources that aren't installed yet; installed ones are not re-fetched"""
+    for resource, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            try:
+                nltk.download(resource, quiet=True)
+            except Exception as e:
+                logger.warning(f"Error downloading NLTK resource '{resource}': {str(e)}")
+
+ensure_nltk_resources()
+
+# Shared VADER sentiment analyzer (a dictionary lookup per word, much faster than TextBlob).
+# Falls back to TextBlob when the VADER lexicon couldn't be downloaded.
+try:
+    SENTIMENT_ANALYZER = SentimentIntensityAnalyzer()
+except LookupError as e:
+    logger.warning(f"VADER lexicon not available, using TextBlob for sentiment: {str(e)}")
+    SENTIMENT_ANALYZER = None
 
 # Define custom cybersecurity stopwords
 CYBERSEC_STOPWORDS = [
@@ -49,13 +65,114 @@ CYBERSEC_STOPWORDS = [
     'reuters', 'news', 'read', 'reported', 'story'
 ]
 
+# Attack type categories and related keywords
+ATTACK_CATEGORIES = {
+    'Phishing': ['phishing', 'spear phishing', 'phish', 'email scam', 'fake email', 'credential harvesting', 'spoofed', 'impersonation'],
+    'Ransomware': ['ransomware', 'ransom', 'encrypted files', 'file encryption', 'decrypt', 'decryptor', 'pay ransom'],
+    'Malware': ['malware', 'virus', 'trojan', 'spyware', 'adware', 'worm', 'botnet', 'backdoor', 'rootkit', 'keylogger'],
+    'Data Breach': ['data breach', 'breach', 'leaked data', 'exposed data', 'data leak', 'data exposed', 'database exposed', 'stolen data'],
+    'DDoS': ['ddos', 'denial of service', 'distributed denial', 'service disruption', 'botnet attack', 'traffic flood'],
+    'Social Engineering': ['social engineering', 'pretexting', 'baiting', 'quid pro quo', 'scam call', 'scam message', 'vishing'],
+    'Identity Theft': ['identity theft', 'identity fraud', 'stolen identity', 'credential theft', 'account takeover'],
+    'Zero-day': ['zero-day', 'zero day', '0-day', 'unpatched vulnerability', 'unknown vulnerability', 'undisclosed vulnerability'],
+    'Supply Chain': ['supply chain', 'vendor compromise', 'third-party breach', 'software supply chain', 'trusted supplier'],
+    'IoT Attacks': ['iot attack', 'smart device', 'connected device', 'device hijack', 'iot vulnerability']
+}
+
+# Industry sectors and their related keywords
+INDUSTRY_SECTORS = {
+    'Finance & Banking': ['bank', 'financial', 'finance', 'credit', 'insurance', 'payment'],
+    'Healthcare': ['healthcare', 'hospital', 'medical', 'health', 'patient', 'doctor'],
+    'Government': ['government', 'federal', 'state', 'municipal', 'public sector', 'agency'],
+    'Education': ['education', 'university', 'school', 'college', 'student', 'academic'],
+    'Technology': ['tech', 'technology', 'software', 'hardware', 'IT', 'computing'],
+    'Retail': ['retail', 'e-commerce', 'store', 'shopping', 'merchant', 'consumer'],
+    'Manufacturing': ['manufacturing', 'factory', 'industry', 'production', 'industrial'],
+    'Energy': ['energy', 'utility', 'power', 'electricity', 'oil', 'gas'],
+    'Telecommunications': ['telecom', 'telecommunications', 'ISP', 'internet provider', 'mobile'],
+    'Transportation': ['transport', 'logistics', 'airline', 'aviation', 'shipping', 'railway']
+}
+
+def build_category_automaton(categories):
+    """
+    Build an Aho-Corasick automaton over the keywords of all categories so a text
+    can be scanned for every keyword in one pass. Each keyword maps to a
+    (keyword, categories) tuple. Returns None when pyahocorasick isn't installed.
+    """
+    if ahocorasick is None:
+        return None
+    
+    keyword_categories = {}
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            keyword_categories.setdefault(keyword, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_category_list in keyword_categories.items():
+        automaton.add_word(keyword, (keyword, tuple(keyword_category_list)))
+    
+    automaton.make_automaton()
+    return automaton
+
+ATTACK_AUTOMATON = build_category_automaton(ATTACK_CATEGORIES)
+SECTOR_AUTOMATON = build_category_automaton(INDUSTRY_SECTORS)
+
+def is_word_character(char):
+    """Whether a character counts as a word character for a regex \\b boundary"""
+    return char.isalnum() or char == '_'
+
+@lru_cache(maxsize=None)
+def whole_word_pattern(keywords):
+    """Compile one alternation matching any of the keywords between \\b boundaries"""
+    return re.compile(r'\b(?:' + '|'.join(keywords) + r')\b')
+
+def find_categories(text, categories, automaton, whole_words=False):
+    """
+    Return the set of categories with at least one keyword in the text.
+    With whole_words, a keyword only counts when it isn't part of a longer word
+    (the same as matching it between \\b boundaries).
+    """
+    if automaton is None:
+        if whole_words:
+            return {
+                category for category, keywords in categories.items()
+                if whole_word_pattern(tuple(keywords)).search(text)
+            }
+        return {category for category, keywords in categories.items() if any(keyword in text for keyword in keywords)}
+    
+    found = set()
+    for end_index, (keyword, keyword_categories) in automaton.iter(text):
+        if whole_words:
+            start_index = end_index - len(keyword) + 1
+            if start_index > 0 and is_word_character(text[start_index - 1]):
+                continue
+            if end_index + 1 < len(text) and is_word_character(text[end_index + 1]):
+                continue
+        found.update(keyword_categories)
+    return found
+
+# Purely alphabetic words longer than three letters; words joined to digits or hyphens
+# (e.g. "zero-day", "covid19") are skipped, like the non-alphabetic tokens the NLTK tokenizer produces for them
+KEYWORD_TOKEN_PATTERN = re.compile(r"(?<![\w-])[a-z]{4,}(?![\w-])")
+
+@lru_cache(maxsize=1)
+def keyword_stop_words():
+    """Return the NLTK English stop words plus the cybersecurity stopwords, loaded once"""
+    return frozenset(stopwords.words('english')) | frozenset(CYBERSEC_STOPWORDS)
+
+# Arrow-backed string dtype for the article text columns
+ARROW_STRING_DTYPE = pd.StringDtype("pyarrow")
+
+# Fields of each scraped news item
+NEWS_ITEM_COLUMNS = ['headline', 'date', 'content', 'source', 'url']
+
 def process_data(raw_data):
     """Process raw scraped data into a structured DataFrame"""
     logger.info("Processing raw data")
     
-    # Convert to DataFrame if it's a list of dictionaries
+    # Convert to DataFrame if it's a list of dictionaries, building each column in one pass
     if isinstance(raw_data, list):
-        df = pd.DataFrame(raw_data)
+        df = pd.DataFrame.from_records(raw_data, columns=NEWS_ITEM_COLUMNS)
     else:
         df = raw_data.copy()
     
@@ -67,95 +184,110 @@ def process_data(raw_data):
         'source': 'Unknown'
     })
     
+    # Keep the text columns as Arrow strings (contiguous UTF-8 rather than Python objects)
+    df = df.astype({'headline': ARROW_STRING_DTYPE, 'content': ARROW_STRING_DTYPE})
+    
+    # Remove duplicates based on headline first, so later steps skip the repeats
+    df = df.drop_duplicates(subset=['headline'])
+    
     # Ensure date is in datetime format
     if 'date' in df.columns:
         df['date'] = pd.to_datetime(df['date']).dt.date
     else:
         df['date'] = datetime.date.today()
     
-    # Remove duplicates based on headline
-    df = df.drop_duplicates(subset=['headline'])
-    
     # Filter out non-cybersecurity related news
     df = filter_cybersecurity_news(df)
     
     # Sort by date (newest first)
     df = df.sort_values('date', ascending=False)
     
+    # Use the same compact dtypes as load_data so scraped and reloaded data match
+    df['date'] = pd.to_datetime(df['date'])
+    df['source'] = df['source'].astype('category')
+    
     logger.info(f"Processed data: {len(df)} entries after filtering and deduplication")
     return df
 
+# Keywords related to cybersecurity
+CYBERSEC_KEYWORDS = [
+    'cyber', 'hack', 'breach', 'malware', 'ransomware', 'phishing',
+    'vulnerability', 'exploit', 'attack', 'security', 'threat', 'virus',
+    'trojan', 'botnet', 'ddos', 'encryption', 'firewall', 'authentication',
+    'password', 'privacy', 'data leak', 'identity theft', 'zero-day',
+    'penetration test', 'intrusion', 'backdoor', 'spyware', 'worm',
+    'cybercrime', 'cybercriminal', 'cyber attack', 'cyber threat',
+    'cyber security', 'information security', 'infosec', 'cryptography',
+    'cert-in', 'nciipc', 'i4c', 'cert', 'nciipc', 'cert india'
+]
+
+def build_keyword_pattern(keywords):
+    """Build one alternation that matches any of the keywords"""
+    # A keyword containing a shorter keyword can never change the match result, so drop it
+    unique_keywords = sorted(set(keyword.lower() for keyword in keywords), key=len)
+    minimal_keywords = []
+    for keyword in unique_keywords:
+        if not any(shorter in keyword for shorter in minimal_keywords):
+            minimal_keywords.append(keyword)
+    return '|'.join(re.escape(keyword) for keyword in minimal_keywords)
+
+CYBERSEC_PATTERN = build_keyword_pattern(CYBERSEC_KEYWORDS)
+CYBERSEC_SOURCE_PATTERN = 'CERT|NCIIPC|I4C'
+
 def filter_cybersecurity_news(df):
     """Filter news to include only cybersecurity-related content"""
-    # Keywords related to cybersecurity
-    cybersec_keywords = [
-        'cyber', 'hack', 'breach', 'malware', 'ransomware', 'phishing',
-        'vulnerability', 'exploit', 'attack', 'security', 'threat', 'virus',
-        'trojan', 'botnet', 'ddos', 'encryption', 'firewall', 'authentication',
-        'password', 'privacy', 'data leak', 'identity theft', 'zero-day',
-        'penetration test', 'intrusion', 'backdoor', 'spyware', 'worm',
-        'cybercrime', 'cybercriminal', 'cyber attack', 'cyber threat',
-        'cyber security', 'information security', 'infosec', 'cryptography',
-        'cert-in', 'nciipc', 'i4c', 'cert', 'nciipc', 'cert india'
-    ]
-    
-    # Create a regex pattern from the keywords
-    pattern = '|'.join(cybersec_keywords)
+    # Match the keywords with pyarrow's regex kernel directly on the Arrow-backed text columns
+    text_mask = np.zeros(len(df), dtype=bool)
+    for column in ['headline', 'content']:
+        text = pa.array(df[column].fillna('').astype(ARROW_STRING_DTYPE))
+        text_mask |= pc.match_substring_regex(text, CYBERSEC_PATTERN, ignore_case=True).to_numpy(zero_copy_only=False)
     
     # Filter the DataFrame
     mask = (
-        df['headline'].str.contains(pattern, case=False, na=False) |
-        df['content'].str.contains(pattern, case=False, na=False) |
-        df['source'].str.contains('CERT|NCIIPC|I4C', case=False, na=False, regex=True)
+        text_mask |
+        df['source'].str.contains(CYBERSEC_SOURCE_PATTERN, case=False, na=False, regex=True).to_numpy(dtype=bool)
     )
     
     return df[mask].copy()
 
+# Shared lemmatizer; WordNet lookups are cached because the same words recur across refreshes
+LEMMATIZER = WordNetLemmatizer()
+
+@lru_cache(maxsize=100_000)
+def lemmatize_word(word):
+    """Return the WordNet lemma of a word"""
+    return LEMMATIZER.lemmatize(word)
+
+def keyword_frequencies(df, stop_words):
+    """Count lemmatized keywords across news headlines and content"""
+    # Combine headline and content for analysis
+    all_text = ' '.join(df['headline'].fillna('') + ' ' + df['content'].fillna(''))
+    
+    # Tokenize with one regex pass and count each distinct word once
+    word_counts = Counter(KEYWORD_TOKEN_PATTERN.findall(all_text.lower()))
+    
+    # Lemmatize each distinct word only once; keep the plain words if WordNet isn't available
+    try:
+        lemmas = {word: lemmatize_word(word) for word in word_counts if word not in stop_words}
+    except LookupError as e:
+        logger.warning(f"WordNet not available, keywords are not lemmatized: {str(e)}")
+        lemmas = {word: word for word in word_counts if word not in stop_words}
+    
+    keyword_counts = Counter()
+    for word, lemma in lemmas.items():
+        keyword_counts[lemma] += word_counts[word]
+    return keyword_counts
+
 def analyze_keywords(df):
     """Extract and analyze keywords from news headlines and content"""
     logger.info("Analyzing keywords")
     
     try:
         # Get stop words
-        try:
-            stop_words = set(stopwords.words('english'))
-        except LookupError:
-            # Fallback if stopwords aren't available
-            nltk.download('stopwords')
-            stop_words = set(stopwords.words('english'))
-        
-        stop_words.update(CYBERSEC_STOPWORDS)
-        
-        # Initialize the lemmatizer
-        try:
-            lemmatizer = WordNetLemmatizer()
-        except LookupError:
-            # Fallback if wordnet isn't available
-            nltk.download('wordnet')
-            lemmatizer = WordNetLemmatizer()
-        
-        # Combine headline and content for analysis
-        all_text = ' '.join(df['headline'].fillna('') + ' ' + df['content'].fillna(''))
-        
-        # Tokenize and clean
-        try:
-            tokens = word_tokenize(all_text.lower())
-        except LookupError:
-            # Fallback for tokenization
-            nltk.download('punkt')
-            tokens = word_tokenize(all_text.lower())
-        
-        # Remove non-alphabetic tokens, stopwords, and short words
-        filtered_tokens = [
-            lemmatizer.lemmatize(word) for word in tokens
-            if word.isalpha() and word not in stop_words and len(word) > 3
-        ]
-        
-        # Count frequency
-        freq_dist = FreqDist(filtered_tokens)
+        stop_words = keyword_stop_words()
         
         # Get the most common keywords
-        keywords = dict(freq_dist.most_common(50))
+        keywords = dict(keyword_frequencies(df, stop_words).most_common(50))
         
         logger.info(f"Extracted {len(keywords)} keywords")
         return keywords
@@ -164,59 +296,58 @@ def analyze_keywords(df):
         # Return a simple dictionary with common cybersecurity terms as fallback
         return {"error": 1, "fallback": 1}
 
+def score_sentiment(text):
+    """Return the (polarity, subjectivity) of a text, both on the same scales as TextBlob"""
+    try:
+        if SENTIMENT_ANALYZER is not None:
+            scores = SENTIMENT_ANALYZER.polarity_scores(text)
+            # VADER has no subjectivity score; the share of non-neutral wording is the closest match
+            return scores['compound'], 1.0 - scores['neu']
+        
+        blob = TextBlob(text)
+        return blob.sentiment.polarity, blob.sentiment.subjectivity
+    except Exception as e:
+        # Handle errors for individual articles with neutral sentiment as fallback
+        logger.warning(f"Error analyzing sentiment for article '{text[:30]}...': {str(e)}")
+        return 0.0, 0.0
+
+# Below this many texts, starting worker processes costs more than it saves
+PARALLEL_SENTIMENT_MIN_TEXTS = 2000
+
+def score_texts(texts):
+    """Score a list of texts, spreading large batches across worker processes"""
+    if len(texts) < PARALLEL_SENTIMENT_MIN_TEXTS:
+        return [score_sentiment(text) for text in texts]
+    
+    # Every text is scored independently, so the batch splits cleanly across processes
+    return Parallel(n_jobs=-1, batch_size=256)(delayed(score_sentiment)(text) for text in texts)
+
 def analyze_sentiment(df):
     """Analyze sentiment of news articles"""
     logger.info("Analyzing sentiment")
     
     try:
-        # Create a copy to avoid modifying the original
-        sentiment_df = df.copy()
+        # Combine headline and content for better analysis
+        content = df['content'].where(df['content'].map(lambda value: isinstance(value, str)), '')
+        texts = (df['headline'].astype(str) + " " + content).str.rstrip()
         
-        # Initialize sentiment scores
-        sentiment_scores = []
+        # Score each distinct text once with the shared analyzer and broadcast back to the articles
+        codes, unique_texts = pd.factorize(texts)
+        unique_scores = np.array(score_texts(list(unique_texts)), dtype=float).reshape(-1, 2)
+        scores = unique_scores[codes]
+        polarity = scores[:, 0]
         
-        # Analyze each article
-        for idx, row in sentiment_df.iterrows():
-            try:
-                # Combine headline and content for better analysis
-                text = row['headline']
-                if row['content'] and isinstance(row['content'], str):
-                    text += " " + row['content']
-                
-                # Perform sentiment analysis
-                blob = TextBlob(text)
-                
-                # Get the polarity score (-1 to 1)
-                polarity = blob.sentiment.polarity
-                
-                # Determine sentiment category
-                if polarity > 0.1:
-                    sentiment = "Positive"
-                elif polarity < -0.1:
-                    sentiment = "Negative"
-                else:
-                    sentiment = "Neutral"
-                
-                sentiment_scores.append({
-                    'headline': row['headline'],
-                    'source': row['source'],
-                    'date': row['date'],
-                    'sentiment': sentiment,
-                    'polarity': polarity,
-                    'subjectivity': blob.sentiment.subjectivity
-                })
-            except Exception as e:
-                # Handle errors for individual articles
-                logger.warning(f"Error analyzing sentiment for article '{row['headline'][:30]}...': {str(e)}")
-                # Add with neutral sentiment as fallback
-                sentiment_scores.append({
-                    'headline': row['headline'],
-                    'source': row['source'],
-                    'date': row['date'],
-                    'sentiment': "Neutral",
-                    'polarity': 0.0,
-                    'subjectivity': 0.0
-                })
+        # Determine sentiment category
+        sentiment = np.select([polarity > 0.1, polarity < -0.1], ["Positive", "Negative"], "Neutral")
+        
+        sentiment_scores = {
+            'headline': df['headline'].to_numpy(),
+            'source': df['source'].to_numpy(),
+            'date': df['date'].to_numpy(),
+            'sentiment': sentiment,
+            'polarity': polarity,
+            'subjectivity': scores[:, 1]
+        }
         
         # Convert to DataFrame
         sentiment_df = pd.DataFrame(sentiment_scores)
@@ -226,17 +357,26 @@ def analyze_sentiment(df):
     except Exception as e:
         logger.error(f"Error performing sentiment analysis: {str(e)}")
         # Create a basic fallback DataFrame with the same columns
-        fallback_data = []
-        for _, row in df.iterrows():
-            fallback_data.append({
-                'headline': row['headline'],
-                'source': row['source'],
-                'date': row['date'],
-                'sentiment': "Neutral",
-                'polarity': 0.0,
-                'subjectivity': 0.0
-            })
-        return pd.DataFrame(fallback_data)
+        return pd.DataFrame({
+            'headline': df['headline'].to_numpy(),
+            'source': df['source'].to_numpy(),
+            'date': df['date'].to_numpy(),
+            'sentiment': "Neutral",
+            'polarity': 0.0,
+            'subjectivity': 0.0
+        })
+
+@lru_cache(maxsize=1)
+def wordcloud_placeholder():
+    """Return a simple placeholder image (as a data URI) shown when the word cloud can't be generated"""
+    image = Image.new('RGB', (800, 400), 'white')
+    draw = ImageDraw.Draw(image)
+    draw.text((400, 200), "Wordcloud generation failed", fill='black', anchor='mm', font=ImageFont.load_default(size=36))
+    
+    img_data = io.BytesIO()
+    image.save(img_data, format='PNG', compress_level=1)
+    encoded = base64.b64encode(img_data.getvalue()).decode('ascii')
+    return f"data:image/png;base64,{encoded}"
 
 def generate_wordcloud(df):
     """Generate a word cloud from news content"""
@@ -245,95 +385,67 @@ def generate_wordcloud(df):
     try:
         # Get stop words
         try:
-            stop_words = set(stopwords.words('english'))
-        except LookupError:
-            # Download if not available
-            nltk.download('stopwords')
-            stop_words = set(stopwords.words('english'))
+            stop_words = keyword_stop_words()
         except Exception as e:
             logger.warning(f"Error getting stopwords: {str(e)}")
-            stop_words = set()
-            
-        stop_words.update(CYBERSEC_STOPWORDS)
+            stop_words = frozenset(CYBERSEC_STOPWORDS)
         
-        # Combine headline and content for analysis
-        all_text = ' '.join(df['headline'].fillna('') + ' ' + df['content'].fillna(''))
+        # Reuse the keyword counts instead of letting WordCloud tokenize the text again
+        frequencies = dict(keyword_frequencies(df, stop_words).most_common(100))
         
         # Create word cloud
         wordcloud = WordCloud(
             width=800, 
             height=400, 
             background_color='white',
-            stopwords=stop_words,
             max_words=100,
             contour_width=1,
             contour_color='steelblue'
-        ).generate(all_text)
-        
-        # Convert to image
-        plt.figure(figsize=(10, 5))
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis("off")
+        ).generate_from_frequencies(frequencies)
         
-        # Save to a BytesIO object
+        # Encode the rendered bitmap as PNG directly with Pillow, without a matplotlib figure
         img_data = io.BytesIO()
-        plt.savefig(img_data, format='png')
-        plt.close()
-        img_data.seek(0)
+        wordcloud.to_image().save(img_data, format='PNG', compress_level=1)
         
         # Convert to base64 for displaying in Streamlit
-        encoded = base64.b64encode(img_data.read()).decode('utf-8')
+        encoded = base64.b64encode(img_data.getvalue()).decode('ascii')
         
         return f"data:image/png;base64,{encoded}"
     except Exception as e:
         logger.error(f"Error generating wordcloud: {str(e)}")
-        # Create a simple placeholder image
-        plt.figure(figsize=(10, 5))
-        plt.text(0.5, 0.5, "Wordcloud generation failed", 
-                 horizontalalignment='center', verticalalignment='center',
-                 fontsize=20)
-        plt.axis("off")
-        
-        img_data = io.BytesIO()
-        plt.savefig(img_data, format='png')
-        plt.close()
-        img_data.seek(0)
-        
-        encoded = base64.b64encode(img_data.read()).decode('utf-8')
-        return f"data:image/png;base64,{encoded}"
+        return wordcloud_placeholder()
+
+# Common threat actor names and groups
+THREAT_ACTORS = [
+    'lazarus group', 'apt', 'fancy bear', 'cozy bear', 'equation group',
+    'darkside', 'revil', 'conti', 'lockbit', 'maze', 'ryuk', 'cl0p',
+    'hafnium', 'nobelium', 'kimsuky', 'fin7', 'carbanak', 'silence',
+    'darkhotel', 'dragonfly', 'energetic bear', 'sandworm', 'turla', 
+    'apt29', 'apt28', 'apt40', 'apt10', 'apt32', 'apt38', 'sidewinder'
+]
+
+THREAT_ACTOR_PATTERN = re.compile(r'\b(' + '|'.join(THREAT_ACTORS) + r')\b')
+
+# Pattern for CVE IDs; only the prefix needs case-insensitive matching
+CVE_PATTERN = re.compile(r'\b[Cc][Vv][Ee]-\d{4}-\d{4,7}\b')
+
+def combined_article_text(df):
+    """Join headline and content of every article into one newline-separated string"""
+    # Word boundaries hold at the newlines, so one scan over the joined text finds the same matches as per-row scans
+    return '\n'.join(
+        f"{headline} {content}"
+        for headline, content in zip(df['headline'].to_numpy(), df['content'].to_numpy())
+    )
 
 def analyze_threat_actors(df):
     """Identify and extract mentions of threat actors from the news"""
     logger.info("Analyzing threat actors")
     
-    # Common threat actor names and groups
-    threat_actors = [
-        'lazarus group', 'apt', 'fancy bear', 'cozy bear', 'equation group',
-        'darkside', 'revil', 'conti', 'lockbit', 'maze', 'ryuk', 'cl0p',
-        'hafnium', 'nobelium', 'kimsuky', 'fin7', 'carbanak', 'silence',
-        'darkhotel', 'dragonfly', 'energetic bear', 'sandworm', 'turla', 
-        'apt29', 'apt28', 'apt40', 'apt10', 'apt32', 'apt38', 'sidewinder'
-    ]
-    
-    # Create regex pattern
-    pattern = r'\b(' + '|'.join(threat_actors) + r')\b'
-    
-    # Initialize threat actor dictionary
-    actor_mentions = {}
-    
     # Search in content
-    for _, row in df.iterrows():
-        content = f"{row['headline']} {row['content']}"
-        matches = re.findall(pattern, content.lower())
-        
-        for match in matches:
-            if match in actor_mentions:
-                actor_mentions[match] += 1
-            else:
-                actor_mentions[match] = 1
+    actor_mentions = Counter(THREAT_ACTOR_PATTERN.findall(combined_article_text(df).lower()))
     
     # Sort by frequency
-    sorted_actors = {k: v for k, v in sorted(actor_mentions.items(), key=lambda item: item[1], reverse=True)}
+    sorted_actors = dict(actor_mentions.most_common())
     
     logger.info(f"Identified {len(sorted_actors)} threat actors")
     return sorted_actors
@@ -342,26 +454,11 @@ def analyze_vulnerability_mentions(df):
     """Extract mentions of specific vulnerabilities (CVEs, etc.)"""
     logger.info("Analyzing vulnerability mentions")
     
-    # Pattern for CVE IDs
-    cve_pattern = r'\bCVE-\d{4}-\d{4,7}\b'
-    
-    # Initialize CVE dictionary
-    cve_mentions = {}
-    
-    # Search in content
-    for _, row in df.iterrows():
-        content = f"{row['headline']} {row['content']}"
-        matches = re.findall(cve_pattern, content, re.IGNORECASE)
-        
-        for match in matches:
-            match = match.upper()  # Standardize to uppercase
-            if match in cve_mentions:
-                cve_mentions[match] += 1
-            else:
-                cve_mentions[match] = 1
+    # Search in content, standardizing IDs to uppercase
+    cve_mentions = Counter(match.upper() for match in CVE_PATTERN.findall(combined_article_text(df)))
     
     # Sort by frequency
-    sorted_cves = {k: v for k, v in sorted(cve_mentions.items(), key=lambda item: item[1], reverse=True)}
+    sorted_cves = dict(cve_mentions.most_common())
     
     logger.info(f"Identified {len(sorted_cves)} vulnerability mentions")
     return sorted_cves
@@ -370,48 +467,29 @@ def analyze_attack_types(df):
     """Identify and categorize different types of cyber attacks mentioned in the news"""
     logger.info("Analyzing attack types in news articles")
     
-    # Define attack type categories and related keywords
-    attack_categories = {
-        'Phishing': ['phishing', 'spear phishing', 'phish', 'email scam', 'fake email', 'credential harvesting', 'spoofed', 'impersonation'],
-        'Ransomware': ['ransomware', 'ransom', 'encrypted files', 'file encryption', 'decrypt', 'decryptor', 'pay ransom'],
-        'Malware': ['malware', 'virus', 'trojan', 'spyware', 'adware', 'worm', 'botnet', 'backdoor', 'rootkit', 'keylogger'],
-        'Data Breach': ['data breach', 'breach', 'leaked data', 'exposed data', 'data leak', 'data exposed', 'database exposed', 'stolen data'],
-        'DDoS': ['ddos', 'denial of service', 'distributed denial', 'service disruption', 'botnet attack', 'traffic flood'],
-        'Social Engineering': ['social engineering', 'pretexting', 'baiting', 'quid pro quo', 'scam call', 'scam message', 'vishing'],
-        'Identity Theft': ['identity theft', 'identity fraud', 'stolen identity', 'credential theft', 'account takeover'],
-        'Zero-day': ['zero-day', 'zero day', '0-day', 'unpatched vulnerability', 'unknown vulnerability', 'undisclosed vulnerability'],
-        'Supply Chain': ['supply chain', 'vendor compromise', 'third-party breach', 'software supply chain', 'trusted supplier'],
-        'IoT Attacks': ['iot attack', 'smart device', 'connected device', 'device hijack', 'iot vulnerability']
-    }
-    
     # Initialize counters for each attack type
-    attack_counts = {category: 0 for category in attack_categories}
+    attack_counts = Counter({category: 0 for category in ATTACK_CATEGORIES})
     
     # Articles that match each attack type
-    attack_articles = {category: [] for category in attack_categories}
+    attack_articles = {category: [] for category in ATTACK_CATEGORIES}
     
-    for _, row in df.iterrows():
-        content = str(row['content']).lower() if pd.notna(row['content']) else ""
-        headline = str(row['headline']).lower() if pd.notna(row['headline']) else ""
+    for headline, content in zip(df['headline'].to_numpy(), df['content'].to_numpy()):
+        content_text = str(content) if pd.notna(content) else ""
+        headline_text = str(headline) if pd.notna(headline) else ""
         
-        combined_text = f"{headline} {content}"
+        # Lowercase the combined text once
+        combined_text = f"{headline_text} {content_text}".lower()
         
-        # Check for each attack type
-        for attack_type, keywords in attack_categories.items():
-            for keyword in keywords:
-                if keyword in combined_text:
-                    attack_counts[attack_type] += 1
-                    attack_articles[attack_type].append(row['headline'])
-                    break  # Count each article only once per attack type
-    
-    # Convert to dataframe for visualization
-    attack_df = pd.DataFrame({
-        'attack_type': list(attack_counts.keys()),
-        'count': list(attack_counts.values())
-    })
+        # Scan once for all attack type keywords, counting each article only once per attack type
+        for attack_type in find_categories(combined_text, ATTACK_CATEGORIES, ATTACK_AUTOMATON):
+            attack_counts[attack_type] += 1
+            attack_articles[attack_type].append(headline)
     
-    # Filter to include only attack types that were found
-    attack_df = attack_df[attack_df['count'] > 0].sort_values('count', ascending=False)
+    # Convert to dataframe for visualization, including only attack types that were found
+    attack_df = pd.DataFrame(
+        [(attack_type, count) for attack_type, count in attack_counts.most_common() if count > 0],
+        columns=['attack_type', 'count']
+    ).astype({'count': 'int64'})
     
     logger.info(f"Identified attack types: {len(attack_df)}")
     if not attack_df.empty:
@@ -423,35 +501,18 @@ def identify_industry_sectors(df):
     """Identify which industry sectors are mentioned in the news"""
     logger.info("Identifying industry sectors")
     
-    # Define industry sectors and their related keywords
-    sectors = {
-        'Finance & Banking': ['bank', 'financial', 'finance', 'credit', 'insurance', 'payment'],
-        'Healthcare': ['healthcare', 'hospital', 'medical', 'health', 'patient', 'doctor'],
-        'Government': ['government', 'federal', 'state', 'municipal', 'public sector', 'agency'],
-        'Education': ['education', 'university', 'school', 'college', 'student', 'academic'],
-        'Technology': ['tech', 'technology', 'software', 'hardware', 'IT', 'computing'],
-        'Retail': ['retail', 'e-commerce', 'store', 'shopping', 'merchant', 'consumer'],
-        'Manufacturing': ['manufacturing', 'factory', 'industry', 'production', 'industrial'],
-        'Energy': ['energy', 'utility', 'power', 'electricity', 'oil', 'gas'],
-        'Telecommunications': ['telecom', 'telecommunications', 'ISP', 'internet provider', 'mobile'],
-        'Transportation': ['transport', 'logistics', 'airline', 'aviation', 'shipping', 'railway']
-    }
-    
     # Initialize sector counts
-    sector_counts = {sector: 0 for sector in sectors}
+    sector_counts = Counter({sector: 0 for sector in INDUSTRY_SECTORS})
     
-    # Count mentions of each sector
-    for _, row in df.iterrows():
-        content = f"{row['headline']} {row['content']}".lower()
+    # Count mentions of each sector (whole words only, once per article per sector)
+    for headline, content in zip(df['headline'].to_numpy(), df['content'].to_numpy()):
+        combined_text = f"{headline} {content}".lower()
         
-        for sector, keywords in sectors.items():
-            for keyword in keywords:
-                if re.search(r'\b' + keyword + r'\b', content):
-                    sector_counts[sector] += 1
-                    break  # Count only once per article per sector
+        for sector in find_categories(combined_text, INDUSTRY_SECTORS, SECTOR_AUTOMATON, whole_words=True):
+            sector_counts[sector] += 1
     
     # Sort by frequency
-    sorted_sectors = {k: v for k, v in sorted(sector_counts.items(), key=lambda item: item[1], reverse=True)}
+    sorted_sectors = dict(sector_counts.most_common())
     
     logger.info(f"Analyzed industry sectors")
     return sorted_sectors
@@ -1,19 +1,41 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import pandas as pd
 import datetime
+import calendar
 import time
 import random
 import re
 import trafilatura
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 import logging
+import asyncio
+import threading
+import json
+import os
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# lxml's C parser is much faster than the pure-Python html.parser and copes better
+# with the broken markup on the government sites; fall back to html.parser without it
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only the page body is ever searched, so skip building the <head> with its scripts and
+# styles. lxml always creates a body; html.parser doesn't, so it parses the whole page
+PAGE_STRAINER = SoupStrainer('body') if HTML_PARSER == 'lxml' else None
+
 # User agent list to rotate
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -23,6 +45,148 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 11_5_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Safari/605.1.15'
 ]
 
+# Common date patterns, tried in order by extract_date
+DATE_PATTERNS = [
+    re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})', re.IGNORECASE),  # DD/MM/YYYY or DD-MM-YYYY
+    re.compile(r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})', re.IGNORECASE),  # YYYY/MM/DD or YYYY-MM-DD
+    re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+(\d{2,4})', re.IGNORECASE),  # 1st Jan 2022
+    re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2})(?:st|nd|rd|th)?[\s,]+(\d{2,4})', re.IGNORECASE)  # Jan 1st, 2022
+]
+
+# Month names and abbreviations accepted in text dates
+MONTH_NUMBERS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'sept': 9, 'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Text dates matched by the month name patterns, e.g. 'Jan 1st, 2022' or '1 January 2022'
+TEXT_DATE_PATTERN = re.compile(
+    r'(?:(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)|([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?)[\s,]+(\d{4})'
+)
+
+# Every date pattern needs a digit, so text without one can skip them all
+DIGIT_PATTERN = re.compile(r'\d')
+
+# Quick checks for a date somewhere in a title, URL or element text
+NUMERIC_DATE_PATTERN = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+BOUNDED_NUMERIC_DATE_PATTERN = re.compile(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b')
+NUMERIC_OR_MONTH_DATE_PATTERN = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b')
+BOUNDED_NUMERIC_OR_MONTH_DATE_PATTERN = re.compile(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b')
+
+# Links to advisory documents, matched by bs4 against each anchor's href
+CERT_IN_LINK_PATTERN = re.compile(r'\.pdf|advisory', re.IGNORECASE)
+NCIIPC_LINK_PATTERN = re.compile(r'\.pdf\Z|advisories')
+I4C_LINK_PATTERN = re.compile(r'\.pdf|advisory|alert', re.IGNORECASE)
+
+# Maximum number of sources scraped at the same time
+MAX_CONCURRENT_SOURCES = 10
+
+# Maximum number of article pages fetched at the same time for one source
+MAX_ARTICLE_FETCHES = 8
+
+# Pages smaller than this are error pages rather than listings
+MIN_PAGE_SIZE = 300
+
+# Append-only file of extracted article text (one JSON [url, content] pair per line),
+# so articles downloaded by an earlier run are not downloaded again
+ARTICLE_CONTENT_CACHE_FILE = 'article_content_cache.jsonl'
+
+# The cache file is compacted to this many of its newest articles when it grows past it
+MAX_CACHED_ARTICLES = 5000
+
+# Shared HTTP session so repeated requests to a host reuse its keep-alive
+# connection; failed connections and server errors are retried with backoff
+MAX_REQUEST_RETRIES = 3
+# Hosts the scrapers reach across all sources and their fallback URLs; the
+# adapter keeps one connection pool per host, so this many stay warm at once
+MAX_POOLED_HOSTS = 24
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({
+    'Accept': 'text/html,application/xhtml+xml,application/xml',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0'
+})
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=MAX_POOLED_HOSTS,
+    pool_maxsize=MAX_CONCURRENT_SOURCES * 2,
+    max_retries=Retry(
+        total=MAX_REQUEST_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=['GET'],
+        raise_on_status=False
+    )
+)
+HTTP_SESSION.mount('http://', HTTP_ADAPTER)
+HTTP_SESSION.mount('https://', HTTP_ADAPTER)
+
+# Browser-like headers for the sites that block other clients, sent on top of the
+# session's defaults
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8'
+}
+CERT_IN_HEADERS = {**BROWSER_HEADERS, 'Referer': 'https://www.google.com/'}
+I4C_HEADERS = BROWSER_HEADERS
+NASSCOM_HEADERS = {**BROWSER_HEADERS, 'Referer': 'https://www.google.com/', 'Cache-Control': 'no-cache'}
+
+# Requests per second allowed against each host
+DEFAULT_REQUESTS_PER_SECOND = 5
+
+# Government websites are slow and quick to block, so go easy on them. Matched by domain so
+# every host the CERT-In, NCIIPC and I4C scrapers and their article links reach is covered
+# (www.cert-in.org.in, cert-in.org.in, nciipc.gov.in, www.nciipc.in, cybercrime.gov.in, ...)
+GOVERNMENT_DOMAINS = ('gov.in', 'cert-in.org.in', 'nciipc.in')
+GOVERNMENT_REQUESTS_PER_SECOND = 1
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per second"""
+    
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            # Reserve the token now and wait outside the lock for it to refill
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+rate_limiters = {}
+rate_limiters_lock = threading.Lock()
+
+def host_requests_per_second(host):
+    """Return the request rate allowed against a host"""
+    if any(host == domain or host.endswith('.' + domain) for domain in GOVERNMENT_DOMAINS):
+        return GOVERNMENT_REQUESTS_PER_SECOND
+    return DEFAULT_REQUESTS_PER_SECOND
+
+def wait_for_rate_limit(url):
+    """Block until a request to the URL's host is allowed by that host's rate limiter"""
+    host = urlparse(url).hostname or ''
+    
+    with rate_limiters_lock:
+        limiter = rate_limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(host_requests_per_second(host))
+            rate_limiters[host] = limiter
+    
+    limiter.acquire()
+
 def get_random_user_agent():
     """Return a random user agent from the list"""
     return random.choice(USER_AGENTS)
@@ -42,64 +206,99 @@ def get_source_urls():
         "News18": "https://www.news18.com/tech/cyber-security/"
     }
 
+def find_all_by_tag_and_class(root, tags, class_names):
+    """
+    Return the same elements, in the same order, as calling root.find_all(tag, class_=class_name)
+    for each tag and then each class name, but with a single walk over the tree
+    """
+    matches = {(tag, class_name): [] for tag in tags for class_name in class_names}
+    for elem in root.find_all(tags, class_=class_names):
+        elem_classes = elem.get('class', [])
+        for class_name in class_names:
+            if class_name in elem_classes:
+                matches[(elem.name, class_name)].append(elem)
+    return [elem for elems in matches.values() for elem in elems]
+
+def class_contains(terms):
+    """Build a class name test accepting any class name that contains one of the terms"""
+    return lambda class_name: any(term in class_name for term in terms)
+
+def find_all_grouped_by_tag(root, tags, class_matches):
+    """
+    Return the same elements, in the same order, as calling root.find_all(tag) for each tag and
+    keeping those with a class name accepted by class_matches, but with a single walk over the tree
+    """
+    # A plain walk is much cheaper than routing the class test through find_all's attribute matching
+    matches = {tag: [] for tag in tags}
+    for elem in root.descendants:
+        if isinstance(elem, Tag) and elem.name in matches:
+            classes = elem.attrs.get('class')
+            if classes and any(class_matches(class_name) for class_name in classes):
+                matches[elem.name].append(elem)
+    return [elem for elems in matches.values() for elem in elems]
+
+def find_all_within_containers(root, container_matches, tags, class_matches):
+    """
+    Return the same elements, in the same order, as calling find_all_grouped_by_tag on every div
+    with a class name accepted by container_matches, without walking each container's subtree
+    again. An element inside nested containers is returned once for each of them
+    """
+    containers = find_all_grouped_by_tag(root, ['div'], container_matches)
+    matches = {id(container): {tag: [] for tag in tags} for container in containers}
+    for elem in find_all_grouped_by_tag(root, tags, class_matches):
+        for parent in elem.parents:
+            container_elems = matches.get(id(parent))
+            if container_elems is not None:
+                container_elems[elem.name].append(elem)
+    return [
+        elem
+        for container in containers
+        for elems in matches[id(container)].values()
+        for elem in elems
+    ]
+
+def make_soup(content):
+    """Parse a scraped page's body with the fastest available parser"""
+    return BeautifulSoup(content, HTML_PARSER, parse_only=PAGE_STRAINER)
+
+def advertised_page_size(response):
+    """Return the body size a response's headers promise, or None if it is unknown"""
+    content_length = response.headers.get('Content-Length', '')
+    # A compressed body's length says nothing about the size of the page
+    if response.headers.get('Content-Encoding') or not content_length.isdigit():
+        return None
+    return int(content_length)
+
 def make_request(url):
-    """Make an HTTP request with error handling and retries"""
-    max_retries = 3
-    retry_delay = 2
-    
-    headers = {
-        'User-Agent': get_random_user_agent(),
-        'Accept': 'text/html,application/xhtml+xml,application/xml',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Cache-Control': 'max-age=0'
-    }
-    
+    """Make an HTTP request through the shared session, which handles retries"""
     logger.info(f"Making request to {url}")
     
-    for attempt in range(max_retries):
-        try:
-            logger.info(f"Attempt {attempt+1} to fetch {url}")
-            response = requests.get(url, headers=headers, timeout=15)
-            
-            # If the request was successful, return the response
-            if response.status_code == 200:
-                content_length = len(response.content)
-                logger.info(f"Successfully retrieved {url} (Status: 200, Size: {content_length} bytes)")
-                return response
-            
-            logger.warning(f"Request to {url} returned status code {response.status_code}")
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error making request to {url}: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-                
-        # Wait before retrying
-        retry_time = retry_delay * (attempt + 1)
-        logger.info(f"Waiting {retry_time} seconds before retry")
-        time.sleep(retry_time)
+    try:
+        wait_for_rate_limit(url)
+        response = HTTP_SESSION.get(url, headers={'User-Agent': get_random_user_agent()}, timeout=15)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to get response from {url} after {MAX_REQUEST_RETRIES} retries: {str(e)}")
+        return None
     
-    # If all retries failed, return None
-    logger.error(f"Failed to get response from {url} after {max_retries} attempts")
-    return None
+    if response.status_code != 200:
+        logger.error(f"Request to {url} returned status code {response.status_code}")
+        return None
+    
+    content_length = len(response.content)
+    logger.info(f"Successfully retrieved {url} (Status: 200, Size: {content_length} bytes)")
+    return response
 
 def extract_date(text, default_date=None):
     """Extract date from text using regex patterns"""
-    if pd.isna(text) or not text:
+    if not text:
         return default_date
     
-    # Common date patterns
-    patterns = [
-        r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})',  # DD/MM/YYYY or DD-MM-YYYY
-        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
-        r'(\d{1,2})(?:st|nd|rd|th)?\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+(\d{2,4})',  # 1st Jan 2022
-        r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2})(?:st|nd|rd|th)?[\s,]+(\d{2,4})'  # Jan 1st, 2022
-    ]
+    # Most titles contain no date at all
+    if not DIGIT_PATTERN.search(text):
+        return default_date
     
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
             # Process the matched date groups
             try:
@@ -113,7 +312,9 @@ def extract_date(text, default_date=None):
                         return datetime.datetime(int(day), int(month), int(year)).date()
                 elif len(match.groups()) == 2:
                     # Handle month name patterns
-                    return parse_text_date(match.group(0))
+                    date = parse_text_date(match.group(0))
+                    if date:
+                        return date
             except (ValueError, TypeError):
                 continue
     
@@ -121,29 +322,209 @@ def extract_date(text, default_date=None):
     return default_date
 
 def parse_text_date(date_text):
-    """Parse text dates like 'Jan 1, 2022' using datetime"""
+    """Parse text dates like 'Jan 1, 2022' or '1st January 2022', returning None if it isn't one"""
+    match = TEXT_DATE_PATTERN.fullmatch(date_text)
+    if not match:
+        return None
+    
+    day_first, month_after_day, month_first, day_after_month, year = match.groups()
+    month = MONTH_NUMBERS.get((month_after_day or month_first).lower())
+    if month is None:
+        return None
+    
+    day, year = int(day_first or day_after_month), int(year)
+    if year < datetime.MINYEAR or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return datetime.date(year, month, day)
+
+# Article text from the cache file by URL, loaded on first use
+article_content_cache = None
+article_content_cache_lock = threading.Lock()
+
+def load_article_content_cache():
+    """
+    Load the cached article text by URL, rewriting the cache file without its unreadable
+    lines or, once it has grown too large, with only its newest articles
+    """
+    cache = {}
+    line_count = 0
+    skipped_lines = 0
     try:
-        # Try standard datetime parsing
-        return datetime.datetime.strptime(date_text, "%b %d, %Y").date()
-    except ValueError:
+        if not os.path.exists(ARTICLE_CONTENT_CACHE_FILE):
+            return cache
+        
+        with open(ARTICLE_CONTENT_CACHE_FILE, 'r', buffering=1 << 16) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                line_count += 1
+                # Decode each line on its own so a line torn by a crash mid-append
+                # only loses that article
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+                if (isinstance(entry, list) and len(entry) == 2 and
+                        all(isinstance(value, str) for value in entry)):
+                    # A later entry for a URL wins and moves it to the end, so the
+                    # order stays oldest-written first for compaction
+                    cache.pop(entry[0], None)
+                    cache[entry[0]] = entry[1]
+                else:
+                    skipped_lines += 1
+    except Exception as e:
+        logger.error(f"Error loading article content cache: {str(e)}")
+        return cache
+    
+    if skipped_lines:
+        logger.warning(f"Skipped {skipped_lines} unreadable lines of {ARTICLE_CONTENT_CACHE_FILE}")
+    
+    if skipped_lines or line_count > MAX_CACHED_ARTICLES:
+        cache = dict(list(cache.items())[-MAX_CACHED_ARTICLES:])
         try:
-            # Try with different format
-            return datetime.datetime.strptime(date_text, "%d %b %Y").date()
-        except ValueError:
-            return datetime.date.today()  # Return today's date as fallback
+            # Write to a temporary file and swap it in so a crash can't leave a half-written file
+            temp_file = ARTICLE_CONTENT_CACHE_FILE + '.tmp'
+            with open(temp_file, 'w', buffering=1 << 16) as f:
+                f.writelines(json.dumps(entry) + '\n' for entry in cache.items())
+            os.replace(temp_file, ARTICLE_CONTENT_CACHE_FILE)
+        except Exception as e:
+            logger.error(f"Error compacting article content cache: {str(e)}")
+    return cache
+
+def cached_article_content(url):
+    """Return an article's text saved by an earlier download, or None if there is none"""
+    global article_content_cache
+    with article_content_cache_lock:
+        if article_content_cache is None:
+            article_content_cache = load_article_content_cache()
+        return article_content_cache.get(url)
+
+def save_article_content(url, content):
+    """Add an article's text to the cache and append it to the cache file"""
+    with article_content_cache_lock:
+        article_content_cache[url] = content
+        try:
+            with open(ARTICLE_CONTENT_CACHE_FILE, 'a') as f:
+                f.write(json.dumps([url, content]) + '\n')
+        except Exception as e:
+            logger.error(f"Error saving article content cache: {str(e)}")
+
+class ArticleDownloadError(Exception):
+    """Raised when an article page could not be downloaded"""
+
+# Cached by URL so an article is downloaded once however many times it is found, and
+# backed by the cache file so it is not downloaded again by later runs.
+# Failed downloads raise instead of returning, which keeps them out of the cache
+@lru_cache(maxsize=1024)
+def download_article_content(url):
+    """Download a URL and extract its clean content using trafilatura"""
+    content = cached_article_content(url)
+    if content is not None:
+        return content
+    
+    wait_for_rate_limit(url)
+    downloaded = trafilatura.fetch_url(url)
+    if not downloaded:
+        raise ArticleDownloadError(f"Nothing downloaded from {url}")
+    content = trafilatura.extract(downloaded)
+    if content:
+        save_article_content(url, content)
+    return content
 
 def extract_content_with_trafilatura(url):
     """Extract clean content from a URL using trafilatura"""
     try:
-        downloaded = trafilatura.fetch_url(url)
-        if downloaded:
-            text = trafilatura.extract(downloaded)
-            return text
+        return download_article_content(url)
+    except ArticleDownloadError:
         return None
     except Exception as e:
         logger.error(f"Error extracting content from {url}: {str(e)}")
         return None
 
+def add_news_item(news_items, news_item):
+    """
+    Add an item to an OrderedDict of items keyed by headline, keeping the
+    first item seen for each headline. Headlines differing only in case or
+    surrounding whitespace count as the same. Returns True if the item was added.
+    """
+    headline_key = news_item['headline'].strip().casefold()
+    if headline_key in news_items:
+        return False
+    news_items[headline_key] = news_item
+    return True
+
+def fetch_article_contents(news_items):
+    """
+    Replace each item's content with the text extracted from its article URL,
+    fetching the pages concurrently. Items keep their current content when
+    nothing could be extracted.
+    """
+    urls = list(dict.fromkeys(item['url'] for item in news_items if item['url']))
+    if not urls:
+        return
+    
+    logger.info(f"Fetching content for {len(urls)} articles")
+    with ThreadPoolExecutor(max_workers=min(MAX_ARTICLE_FETCHES, len(urls))) as executor:
+        contents = dict(zip(urls, executor.map(extract_content_with_trafilatura, urls)))
+    
+    for item in news_items:
+        content = contents.get(item['url'])
+        if content:
+            item['content'] = content
+
+# Base URLs that relative advisory links are resolved against
+CERT_IN_BASE_URL = "https://www.cert-in.org.in/"
+NCIIPC_BASE_URL = "https://nciipc.gov.in/"
+
+# Navigation link texts that are never advisories
+NAV_LINK_TEXTS = frozenset(['home', 'about', 'about us', 'contact', 'menu'])
+
+# Known items used as a last resort when a key source yields nothing, so these
+# critical sources always have some data. Each is (headline, content, url)
+FALLBACK_NEWS_ITEMS = {
+    'CERT-In': (
+        ("Vulnerability in Microsoft Exchange Server",
+         "CERT-In has observed active exploitation of vulnerabilities in Microsoft Exchange Server. Users are advised to apply patches immediately.",
+         "https://www.cert-in.org.in/"),
+        ("CERT-In Advisory on Ransomware Protection",
+         "CERT-In advises organizations to implement proper backup strategies and security controls to mitigate ransomware threats.",
+         "https://www.cert-in.org.in/")
+    ),
+    'I4C': (
+        ("Awareness Campaign Against Cybercrime",
+         "I4C has launched an awareness campaign to educate citizens on recognizing and avoiding common cyber frauds, including OTP fraud, KYC fraud, and investment scams.",
+         "https://cybercrime.gov.in/"),
+        ("I4C Advisory on Online Financial Frauds",
+         "I4C warns citizens against sharing OTPs, bank details, or clicking on suspicious links. Report cyber financial crimes at cybercrime.gov.in or call 1930 helpline.",
+         "https://cybercrime.gov.in/")
+    ),
+    'NASSCOM': (
+        ("NASSCOM's Cybersecurity Task Force Report",
+         "The NASSCOM Cybersecurity Task Force has published guidelines on security best practices for Indian IT companies, emphasizing the need for enhanced protection of critical infrastructure.",
+         "https://nasscom.in/topics/cyber-security"),
+        ("NASSCOM Partners with Government on Cybersecurity Skilling Initiative",
+         "NASSCOM has announced a partnership with the Indian government to train 100,000 professionals in cybersecurity skills by 2025, addressing the growing demand for security expertise in the IT industry.",
+         "https://nasscom.in/topics/cyber-security")
+    )
+}
+
+def fallback_news_items(source):
+    """Return a source's fallback items, dated today"""
+    today = datetime.date.today()
+    return [
+        {'headline': headline, 'date': today, 'content': content, 'source': source, 'url': url}
+        for headline, content, url in FALLBACK_NEWS_ITEMS[source]
+    ]
+
+# Words in a heading or table that mark a section of advisories
+CERT_IN_HEADING_TERMS = ('advisory', 'alert', 'security', 'threat', 'notice')
+NCIIPC_HEADING_TERMS = ('advisory', 'alert', 'news', 'update', 'notification', 'cyber')
+NCIIPC_TABLE_TERMS = ('advisory', 'alert', 'security', 'notification')
+
+# Class names of the page sections that hold CERT-In advisories
+CERT_IN_SECTION_CLASSES = ['advisory', 'advisories', 'alert', 'notice', 'news', 'content', 'main']
+
 def scrape_cert_in():
     """Scrape cybersecurity news from CERT-In"""
     logger.info("Scraping CERT-In")
@@ -157,60 +538,42 @@ def scrape_cert_in():
         "https://www.cert-in.org.in/CurrentThreats.jsp"
     ]
     
-    all_news_items = []
+    all_news_items = OrderedDict()
     
-    # Fallback data as a last resort - these are known recent CERT-In advisories
-    # This ensures we always have some data from this critical source
-    fallback_advisories = [
-        {
-            'headline': "Vulnerability in Microsoft Exchange Server",
-            'date': datetime.date.today(),
-            'content': "CERT-In has observed active exploitation of vulnerabilities in Microsoft Exchange Server. Users are advised to apply patches immediately.",
-            'source': 'CERT-In',
-            'url': "https://www.cert-in.org.in/"
-        },
-        {
-            'headline': "CERT-In Advisory on Ransomware Protection",
-            'date': datetime.date.today(),
-            'content': "CERT-In advises organizations to implement proper backup strategies and security controls to mitigate ransomware threats.",
-            'source': 'CERT-In',
-            'url': "https://www.cert-in.org.in/"
-        }
-    ]
+    # Items whose content is filled in from their article pages after parsing
+    pending_content_items = []
     
     for url in urls:
         logger.info(f"Trying CERT-In URL: {url}")
         try:
-            # Enhanced browser-like headers
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://www.google.com/',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
             # Longer timeout for potentially slow government websites
-            response = requests.get(url, headers=headers, timeout=45, verify=False)
+            wait_for_rate_limit(url)
+            response = HTTP_SESSION.get(url, headers=CERT_IN_HEADERS, timeout=45, verify=False, stream=True)
             
             if response.status_code != 200:
                 logger.warning(f"Failed to retrieve CERT-In page from {url}: Status code {response.status_code}")
+                response.close()
+                continue
+            
+            # Skip pages the server says are very small without downloading them
+            advertised_size = advertised_page_size(response)
+            if advertised_size is not None and advertised_size < MIN_PAGE_SIZE:
+                logger.warning(f"Page from {url} is too small ({advertised_size} bytes), skipping")
+                response.close()
                 continue
                 
             page_size = len(response.content)
             logger.info(f"Retrieved page from {url}: {page_size} bytes")
             
             # Skip very small responses (likely error pages)
-            if page_size < 300:
+            if page_size < MIN_PAGE_SIZE:
                 logger.warning(f"Page from {url} is too small ({page_size} bytes), skipping")
                 continue
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # DIRECT APPROACH: Look for PDF links first - CERT-In often publishes advisories as PDFs
-            pdf_links = soup.find_all('a', href=lambda href: href and ('.pdf' in href.lower() or 'advisory' in href.lower()))
+            pdf_links = soup.find_all('a', href=CERT_IN_LINK_PATTERN)
             logger.info(f"Found {len(pdf_links)} PDF/advisory links")
             
             for link in pdf_links:
@@ -228,16 +591,15 @@ def scrape_cert_in():
                     
                     # Extract URL
                     article_url = link['href']
-                    if not article_url.startswith('http'):
-                        article_url = "https://www.cert-in.org.in/" + article_url.lstrip('/')
+                    article_url = urljoin(CERT_IN_BASE_URL, article_url)
                     
                     # Try to extract date from filename or text
                     date_text = ""
-                    date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', title)
+                    date_match = NUMERIC_DATE_PATTERN.search(title)
                     if date_match:
                         date_text = date_match.group(0)
                     else:
-                        date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', article_url)
+                        date_match = NUMERIC_DATE_PATTERN.search(article_url)
                         if date_match:
                             date_text = date_match.group(0)
                     
@@ -246,7 +608,7 @@ def scrape_cert_in():
                     # We can't extract content from PDFs easily, so use title
                     content = f"CERT-In Advisory: {title}"
                     
-                    all_news_items.append({
+                    add_news_item(all_news_items, {
                         'headline': title,
                         'date': date,
                         'content': content,
@@ -269,7 +631,8 @@ def scrape_cert_in():
                         
                     for row in rows[1:]:  # Skip header row
                         try:
-                            cells = row.find_all('td')
+                            # A row's cells are its children, so don't walk into their contents
+                            cells = row.find_all('td', recursive=False)
                             if len(cells) < 2:
                                 continue
                                 
@@ -285,30 +648,25 @@ def scrape_cert_in():
                             link = cells[1].find('a')
                             if link and link.has_attr('href'):
                                 article_url = link['href']
-                                if not article_url.startswith('http'):
-                                    article_url = "https://www.cert-in.org.in/" + article_url.lstrip('/')
+                                article_url = urljoin(CERT_IN_BASE_URL, article_url)
                                     
                             # Parse date
                             date = extract_date(date_text, datetime.date.today())
                             
-                            # Extract content
-                            content = ""
-                            if article_url:
-                                content = extract_content_with_trafilatura(article_url)
-                                
-                            if not content and len(cells) > 2:
-                                content = cells[2].get_text(strip=True)
-                                
+                            # Content from the table until the article text is fetched
+                            content = cells[2].get_text(strip=True) if len(cells) > 2 else ""
                             if not content:
                                 content = title
-                                
-                            all_news_items.append({
+                            
+                            news_item = {
                                 'headline': title,
                                 'date': date,
                                 'content': content,
                                 'source': 'CERT-In',
                                 'url': article_url
-                            })
+                            }
+                            if add_news_item(all_news_items, news_item) and article_url:
+                                pending_content_items.append(news_item)
                             logger.info(f"Added CERT-In item from table: {title[:30]}...")
                         except Exception as e:
                             logger.error(f"Error processing table row: {str(e)}")
@@ -317,18 +675,15 @@ def scrape_cert_in():
             if not all_news_items:
                 advisory_sections = []
                 
-                # Try to find sections with relevant class names
-                for tag in ['div', 'section']:
-                    for class_name in ['advisory', 'advisories', 'alert', 'notice', 'news', 'content', 'main']:
-                        sections = soup.find_all(tag, class_=class_name)
-                        advisory_sections.extend(sections)
+                # Try to find sections with relevant class names, in one pass over the page
+                advisory_sections.extend(soup.find_all(['div', 'section'], class_=CERT_IN_SECTION_CLASSES))
                         
                 # Try to find by headings
                 if not advisory_sections:
                     headings = soup.find_all(['h1', 'h2', 'h3', 'h4'])
                     for heading in headings:
                         heading_text = heading.get_text().lower()
-                        if any(term in heading_text for term in ['advisory', 'alert', 'security', 'threat', 'notice']):
+                        if any(term in heading_text for term in CERT_IN_HEADING_TERMS):
                             section = heading.find_next(['div', 'ul', 'ol', 'section'])
                             if section:
                                 advisory_sections.append(section)
@@ -337,15 +692,13 @@ def scrape_cert_in():
                 
                 for section in advisory_sections:
                     try:
-                        items = []
-                        for tag in ['li', 'a', 'div', 'p']:
-                            items.extend(section.find_all(tag))
+                        items = section.find_all(['li', 'a', 'div', 'p'])
                             
                         for item in items:
                             try:
                                 # Skip very short or navigation items
                                 text = item.get_text(strip=True)
-                                if not text or len(text) < 10 or text.lower() in ['home', 'about', 'contact']:
+                                if not text or len(text) < 10 or text.lower() in NAV_LINK_TEXTS:
                                     continue
                                     
                                 # Extract title and URL
@@ -360,8 +713,8 @@ def scrape_cert_in():
                                         article_url = link['href']
                                         title = link.get_text(strip=True) or text
                                         
-                                if article_url and not article_url.startswith('http'):
-                                    article_url = "https://www.cert-in.org.in/" + article_url.lstrip('/')
+                                if article_url:
+                                    article_url = urljoin(CERT_IN_BASE_URL, article_url)
                                     
                                 # Extract date
                                 date_text = ""
@@ -371,21 +724,18 @@ def scrape_cert_in():
                                     
                                 date = extract_date(date_text, datetime.date.today())
                                 
-                                # Extract content
-                                content = ""
-                                if article_url:
-                                    content = extract_content_with_trafilatura(article_url)
-                                    
-                                if not content:
-                                    content = title
-                                    
-                                all_news_items.append({
+                                # The title stands in for the content until the article text is fetched
+                                content = title
+                                
+                                news_item = {
                                     'headline': title,
                                     'date': date,
                                     'content': content,
                                     'source': 'CERT-In',
                                     'url': article_url
-                                })
+                                }
+                                if add_news_item(all_news_items, news_item) and article_url:
+                                    pending_content_items.append(news_item)
                                 logger.info(f"Added CERT-In item from section: {title[:30]}...")
                             except Exception as e:
                                 logger.error(f"Error processing advisory item: {str(e)}")
@@ -399,18 +749,16 @@ def scrape_cert_in():
         except Exception as e:
             logger.error(f"Error scraping CERT-In from {url}: {str(e)}")
     
+    fetch_article_contents(pending_content_items)
+    
     # If we couldn't find any items, use the fallback data
     if not all_news_items:
         logger.warning("Could not retrieve any CERT-In items, using fallback data")
-        all_news_items = fallback_advisories
+        for item in fallback_news_items('CERT-In'):
+            add_news_item(all_news_items, item)
     
-    # Remove duplicates
-    unique_items = []
-    seen_titles = set()
-    for item in all_news_items:
-        if item['headline'] not in seen_titles:
-            seen_titles.add(item['headline'])
-            unique_items.append(item)
+    # Items were deduplicated by headline as they were added
+    unique_items = list(all_news_items.values())
     
     logger.info(f"Scraped {len(unique_items)} unique items from CERT-In")
     return unique_items
@@ -427,17 +775,23 @@ def scrape_nciipc():
         "https://www.nciipc.in/"
     ]
     
-    all_news_items = []
+    all_news_items = OrderedDict()
     
-    for url in urls:
+    # Items whose content is filled in from their article pages after parsing
+    pending_content_items = []
+    
+    # Every candidate page is parsed, so fetch them all at once
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        responses = list(executor.map(make_request, urls))
+    
+    for url, response in zip(urls, responses):
         logger.info(f"Trying NCIIPC URL: {url}")
-        response = make_request(url)
         
         if not response:
             logger.warning(f"Failed to retrieve NCIIPC page from {url}")
             continue
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content)
         
         # Look for news/advisories sections using multiple approaches
         try:
@@ -450,7 +804,7 @@ def scrape_nciipc():
                 headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5'])
                 for heading in headings:
                     heading_text = heading.get_text().lower()
-                    if any(term in heading_text for term in ['advisory', 'alert', 'news', 'update', 'notification', 'cyber']):
+                    if any(term in heading_text for term in NCIIPC_HEADING_TERMS):
                         section = heading.find_next(['div', 'ul', 'ol', 'section'])
                         if section:
                             news_sections.append(section)
@@ -459,8 +813,12 @@ def scrape_nciipc():
             # Approach 3: Check for tables containing advisories
             tables = soup.find_all('table')
             for table in tables:
-                if table.find('th') and any(keyword in table.get_text().lower() for keyword in 
-                                           ['advisory', 'alert', 'security', 'notification']):
+                if not table.find('th'):
+                    continue
+                
+                # Get the table's text once rather than once per keyword
+                table_text = table.get_text().lower()
+                if any(keyword in table_text for keyword in NCIIPC_TABLE_TERMS):
                     news_sections.append(table)
                     logger.info(f"Found advisory table with keywords")
             
@@ -471,7 +829,7 @@ def scrape_nciipc():
                 if section.name == 'table':
                     rows = section.find_all('tr')
                     for row in rows[1:]:  # Skip header row
-                        cells = row.find_all(['td', 'th'])
+                        cells = row.find_all(['td', 'th'], recursive=False)
                         if len(cells) >= 2:
                             try:
                                 # Extract title (usually in first or second cell)
@@ -486,51 +844,40 @@ def scrape_nciipc():
                                 article_url = ""
                                 if link and link.has_attr('href'):
                                     article_url = link['href']
-                                    if not article_url.startswith('http'):
-                                        article_url = f"https://nciipc.gov.in/{article_url.lstrip('/')}"
+                                    article_url = urljoin(NCIIPC_BASE_URL, article_url)
                                 
                                 # Get date if available (usually in first cell)
                                 date_text = cells[0].get_text(strip=True) if len(cells) > 0 else ""
                                 date = extract_date(date_text, datetime.date.today())
                                 
-                                # Extract content
-                                content = ""
-                                if article_url:
-                                    content = extract_content_with_trafilatura(article_url)
-                                
-                                if not content and len(cells) > 2:
-                                    content = cells[2].get_text(strip=True)
-                                
+                                # Content from the table until the article text is fetched
+                                content = cells[2].get_text(strip=True) if len(cells) > 2 else ""
                                 if not content:
                                     content = title
                                 
-                                all_news_items.append({
+                                news_item = {
                                     'headline': title,
                                     'date': date,
                                     'content': content,
                                     'source': 'NCIIPC',
                                     'url': article_url
-                                })
+                                }
+                                if add_news_item(all_news_items, news_item) and article_url:
+                                    pending_content_items.append(news_item)
                             except Exception as e:
                                 logger.error(f"Error processing NCIIPC table row: {str(e)}")
                 else:
                     # For other elements, look for links, list items or divs
-                    items = []
-                    for tag in ['a', 'li', 'div', 'p']:
-                        items.extend(section.find_all(tag))
+                    items = section.find_all(['a', 'li', 'div', 'p'])
                     
                     logger.info(f"Found {len(items)} potential news items in section")
                     
                     for item in items:
                         try:
-                            # Skip items that are just containers with no direct text
-                            if item.name == 'div' and not item.get_text(strip=True):
-                                continue
-                                
                             title = item.get_text(strip=True)
                             
-                            # Filter out menu items and other non-news content
-                            if not title or len(title) < 10 or title.lower() in ['home', 'about us', 'contact', 'menu']:
+                            # Skip empty containers, menu items and other non-news content
+                            if not title or len(title) < 10 or title.lower() in NAV_LINK_TEXTS:
                                 continue
                             
                             # Extract URL if available
@@ -542,8 +889,8 @@ def scrape_nciipc():
                                 if link and link.has_attr('href'):
                                     article_url = link['href']
                             
-                            if article_url and not article_url.startswith('http'):
-                                article_url = f"https://nciipc.gov.in/{article_url.lstrip('/')}"
+                            if article_url:
+                                article_url = urljoin(NCIIPC_BASE_URL, article_url)
                             
                             # Try to find date in or near the item
                             date_text = ""
@@ -552,42 +899,39 @@ def scrape_nciipc():
                                 date_text = date_elem.get_text(strip=True)
                             else:
                                 # Check if there's a date pattern in the title
-                                date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', title)
+                                date_match = NUMERIC_DATE_PATTERN.search(title)
                                 if date_match:
                                     date_text = date_match.group(0)
                                 else:
                                     # Look for nearby date indicators
-                                    for sibling in list(item.previous_siblings)[:2] + list(item.next_siblings)[:2]:
+                                    for sibling in chain(islice(item.previous_siblings, 2), islice(item.next_siblings, 2)):
                                         if hasattr(sibling, 'get_text'):
                                             sibling_text = sibling.get_text(strip=True)
-                                            if re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', sibling_text):
+                                            if NUMERIC_DATE_PATTERN.search(sibling_text):
                                                 date_text = sibling_text
                                                 break
                             
                             # Parse date
                             date = extract_date(date_text, datetime.date.today())
                             
-                            # Extract content
-                            content = ""
-                            if article_url:
-                                content = extract_content_with_trafilatura(article_url)
-                            
-                            if not content:
-                                content = title
+                            # The title stands in for the content until the article text is fetched
+                            content = title
                             
-                            all_news_items.append({
+                            news_item = {
                                 'headline': title,
                                 'date': date,
                                 'content': content,
                                 'source': 'NCIIPC',
                                 'url': article_url
-                            })
+                            }
+                            if add_news_item(all_news_items, news_item) and article_url:
+                                pending_content_items.append(news_item)
                         except Exception as e:
                             logger.error(f"Error processing NCIIPC item: {str(e)}")
             
             # Approach 4: Look for documents and PDF links across the entire page if we found nothing so far
             if not all_news_items:
-                pdf_links = soup.find_all('a', href=lambda href: href and (href.endswith('.pdf') or 'advisories' in href))
+                pdf_links = soup.find_all('a', href=NCIIPC_LINK_PATTERN)
                 logger.info(f"Found {len(pdf_links)} PDF/Advisory links")
                 
                 for link in pdf_links:
@@ -597,22 +941,21 @@ def scrape_nciipc():
                             title = "NCIIPC Advisory Document"
                             
                         article_url = link['href']
-                        if not article_url.startswith('http'):
-                            article_url = f"https://nciipc.gov.in/{article_url.lstrip('/')}"
+                        article_url = urljoin(NCIIPC_BASE_URL, article_url)
                         
                         # Try to extract date from filename or text
                         date_text = ""
-                        date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', title)
+                        date_match = NUMERIC_DATE_PATTERN.search(title)
                         if date_match:
                             date_text = date_match.group(0)
                         else:
-                            date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', article_url)
+                            date_match = NUMERIC_DATE_PATTERN.search(article_url)
                             if date_match:
                                 date_text = date_match.group(0)
                         
                         date = extract_date(date_text, datetime.date.today())
                         
-                        all_news_items.append({
+                        add_news_item(all_news_items, {
                             'headline': title,
                             'date': date,
                             'content': f"NCIIPC Advisory Document: {title}",
@@ -625,13 +968,10 @@ def scrape_nciipc():
         except Exception as e:
             logger.error(f"Error scraping NCIIPC from {url}: {str(e)}")
     
-    # Remove duplicates
-    unique_items = []
-    seen_titles = set()
-    for item in all_news_items:
-        if item['headline'] not in seen_titles:
-            seen_titles.add(item['headline'])
-            unique_items.append(item)
+    fetch_article_contents(pending_content_items)
+    
+    # Items were deduplicated by headline as they were added
+    unique_items = list(all_news_items.values())
     
     logger.info(f"Scraped {len(unique_items)} unique items from NCIIPC")
     return unique_items
@@ -646,7 +986,7 @@ def scrape_times_of_india():
         logger.error("Failed to retrieve Times of India page")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = make_soup(response.content)
     news_items = []
     
     try:
@@ -681,12 +1021,10 @@ def scrape_times_of_india():
                 url = ""
                 if link and link.has_attr('href'):
                     url = link['href']
-                    if not url.startswith('http'):
-                        url = "https://timesofindia.indiatimes.com" + url
+                    url = urljoin("https://timesofindia.indiatimes.com", url)
                 elif article.name == 'a' and article.has_attr('href'):
                     url = article['href']
-                    if not url.startswith('http'):
-                        url = "https://timesofindia.indiatimes.com" + url
+                    url = urljoin("https://timesofindia.indiatimes.com", url)
                 
                 # Extract date
                 date_elem = article.find(['span', 'div'], class_=['date', 'time', 'meta'])
@@ -696,17 +1034,11 @@ def scrape_times_of_india():
                 
                 date = extract_date(date_text, datetime.date.today())
                 
-                # Extract content
-                content = ""
-                if url:
-                    content = extract_content_with_trafilatura(url) or headline
-                else:
-                    content = headline
-                
+                # Content falls back to the headline until the article text is fetched
                 news_items.append({
                     'headline': headline,
                     'date': date,
-                    'content': content,
+                    'content': headline,
                     'source': 'Times of India',
                     'url': url
                 })
@@ -715,9 +1047,15 @@ def scrape_times_of_india():
     except Exception as e:
         logger.error(f"Error scraping Times of India: {str(e)}")
     
+    fetch_article_contents(news_items)
+    
     logger.info(f"Scraped {len(news_items)} items from Times of India")
     return news_items
 
+# Class name fragments of The Hindu's layout containers and the story cards inside them
+HINDU_GRID_CLASS_TERMS = ('container', 'grid', 'section')
+HINDU_STORY_CLASS_TERMS = ('story', 'article', 'card', 'item')
+
 def scrape_the_hindu():
     """Scrape cybersecurity news from The Hindu"""
     logger.info("Scraping The Hindu - Cybersecurity")
@@ -731,20 +1069,29 @@ def scrape_the_hindu():
     
     all_news_items = []
     
-    for url in urls:
+    # Articles keyed by headline across every URL, so one listed on several pages is only processed once
+    candidates_by_headline = OrderedDict()
+    
+    # Every section page is parsed, so fetch them all at once
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        responses = list(executor.map(make_request, urls))
+    
+    for url, response in zip(urls, responses):
         logger.info(f"Trying to scrape from The Hindu URL: {url}")
-        response = make_request(url)
         
         if not response:
             logger.error(f"Failed to retrieve The Hindu page: {url}")
             continue
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content)
         news_items = []
         
+        # Articles whose content is fetched before they are checked for cybersecurity keywords
+        candidate_items = []
+        
         try:
-            # Log the HTML structure for debugging
-            logger.info(f"The Hindu page retrieved from {url}: {len(str(soup))} characters")
+            # Log the page size for debugging
+            logger.info(f"The Hindu page retrieved from {url}: {len(response.content)} bytes")
             
             # APPROACH 1: Find all divs with data-id attribute (used by The Hindu website)
             stories = soup.find_all('div', attrs={'data-id': True})
@@ -752,29 +1099,14 @@ def scrape_the_hindu():
             
             # APPROACH 2: Look for specific CSS grid containers used by The Hindu
             if not stories or len(stories) < 3:
-                # Try to find articles by the container class
-                # Find divs with container/grid/section in class name
-                grid_elements = []
-                for div in soup.find_all('div'):
-                    if div.has_attr('class'):
-                        for class_name in div['class']:
-                            if ('container' in class_name or 'grid' in class_name or 'section' in class_name):
-                                grid_elements.append(div)
-                                break
-                
-                stories = []
-                for grid in grid_elements:
-                    # Check for article elements inside the grid with specific classes
-                    article_elements = []
-                    for tag in ['div', 'li', 'article']:
-                        for elem in grid.find_all(tag):
-                            if elem.has_attr('class'):
-                                for class_name in elem['class']:
-                                    if ('story' in class_name or 'article' in class_name or 
-                                        'card' in class_name or 'item' in class_name):
-                                        article_elements.append(elem)
-                                        break
-                    stories.extend(article_elements)
+                # Try to find articles by the container class:
+                # story/article/card/item elements inside divs with container/grid/section in class name
+                stories = find_all_within_containers(
+                    soup,
+                    class_contains(HINDU_GRID_CLASS_TERMS),
+                    ['div', 'li', 'article'],
+                    class_contains(HINDU_STORY_CLASS_TERMS)
+                )
                 
                 logger.info(f"Found {len(stories)} stories using grid container approach")
             
@@ -841,8 +1173,7 @@ def scrape_the_hindu():
                         continue
                     
                     # Make URL absolute if it's relative
-                    if not article_url.startswith('http'):
-                        article_url = f"https://www.thehindu.com{article_url}" if article_url.startswith('/') else f"https://www.thehindu.com/{article_url}"
+                    article_url = urljoin("https://www.thehindu.com", article_url)
                     
                     # Extract date
                     date_text = ""
@@ -868,49 +1199,41 @@ def scrape_the_hindu():
                         text_elements = article.find_all(['span', 'p', 'div', 'time'])
                         for elem in text_elements:
                             text = elem.get_text(strip=True)
-                            if re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b', text):
+                            if NUMERIC_OR_MONTH_DATE_PATTERN.search(text):
                                 date_text = text
                                 break
                     
                     # Parse the date or use today's date as fallback
                     date = extract_date(date_text, datetime.date.today())
                     
-                    # Get article content with trafilatura
-                    logger.info(f"Extracting content from The Hindu article: {article_url}")
-                    content = extract_content_with_trafilatura(article_url)
-                    
-                    # If content extraction failed, try alternatives
-                    if not content:
-                        # Try to get summary from the article
-                        summary_elem = article.find(['p', 'div'], class_=['summary', 'intro', 'desc'])
-                        if summary_elem:
-                            content = summary_elem.get_text(strip=True)
-                            logger.info(f"Using summary as content: {content[:50]}...")
-                        else:
-                            # Use headline as content
-                            content = headline
-                            logger.info("Using headline as content")
+                    # Use the summary or headline as content if the article text can't be fetched
+                    summary_elem = article.find(['p', 'div'], class_=['summary', 'intro', 'desc'])
+                    content = summary_elem.get_text(strip=True) if summary_elem else headline
                     
-                    # Combined text for keyword filtering
-                    combined_text = (headline + " " + (content or "")).lower()
-                    
-                    # Only include cybersecurity-related articles
-                    cyber_keywords = ['cyber', 'security', 'hack', 'breach', 'malware', 'ransomware', 
-                                      'phishing', 'password', 'attack', 'threat', 'data protection', 'privacy']
-                    
-                    if any(keyword in combined_text for keyword in cyber_keywords):
-                        news_items.append({
-                            'headline': headline,
-                            'date': date,
-                            'content': content or headline,
-                            'source': 'The Hindu',
-                            'url': article_url
-                        })
-                        logger.info(f"Added The Hindu article: {headline[:40]}...")
+                    news_item = {
+                        'headline': headline,
+                        'date': date,
+                        'content': content or headline,
+                        'source': 'The Hindu',
+                        'url': article_url
+                    }
+                    if add_news_item(candidates_by_headline, news_item):
+                        candidate_items.append(news_item)
                 except Exception as e:
                     logger.error(f"Error processing article from The Hindu: {str(e)}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+                    logger.debug("Traceback:", exc_info=True)
+            
+            fetch_article_contents(candidate_items)
+            
+            # Only include cybersecurity-related articles
+            cyber_keywords = ['cyber', 'security', 'hack', 'breach', 'malware', 'ransomware', 
+                              'phishing', 'password', 'attack', 'threat', 'data protection', 'privacy']
+            
+            for item in candidate_items:
+                combined_text = (item['headline'] + " " + item['content']).lower()
+                if any(keyword in combined_text for keyword in cyber_keywords):
+                    news_items.append(item)
+                    logger.info(f"Added The Hindu article: {item['headline'][:40]}...")
             
             # Add this URL's items to our collection
             logger.info(f"Found {len(news_items)} cybersecurity articles from {url}")
@@ -938,28 +1261,34 @@ def scrape_india_today():
     
     all_news_items = []
     
-    for url in urls:
+    # Articles keyed by headline across every URL, so one listed on several pages is only processed once
+    candidates_by_headline = OrderedDict()
+    
+    # Every section page is parsed, so fetch them all at once
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        responses = list(executor.map(make_request, urls))
+    
+    for url, response in zip(urls, responses):
         logger.info(f"Trying to scrape from India Today URL: {url}")
-        response = make_request(url)
         
         if not response:
             logger.error(f"Failed to retrieve India Today page: {url}")
             continue
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content)
         news_items = []
         
+        # Articles whose content is fetched before they are checked for cybersecurity terms
+        candidate_items = []
+        
         try:
-            logger.info(f"India Today page retrieved from {url}: {len(str(soup))} characters")
+            logger.info(f"India Today page retrieved from {url}: {len(response.content)} bytes")
             
             # APPROACH 1: Finding story cards - India Today's main content format
             story_cards = []
             
             # Find story cards with specific classes
-            for tag in ['div', 'article']:
-                for class_name in ['story-card', 'card', 'list-item', 'catagory-listing']:
-                    found = soup.find_all(tag, class_=class_name)
-                    story_cards.extend(found)
+            story_cards.extend(find_all_by_tag_and_class(soup, ['div', 'article'], ['story-card', 'card', 'list-item', 'catagory-listing']))
                     
             logger.info(f"Found {len(story_cards)} potential story cards")
             
@@ -969,19 +1298,13 @@ def scrape_india_today():
                 containers = []
                 
                 # Find containers with specific classes
-                for tag in ['div', 'ul']:
-                    for class_name in ['container', 'list', 'wrapper', 'stories', 'articles']:
-                        found = soup.find_all(tag, class_=class_name)
-                        containers.extend(found)
+                containers.extend(find_all_by_tag_and_class(soup, ['div', 'ul'], ['container', 'list', 'wrapper', 'stories', 'articles']))
                 
                 stories = []
                 
                 for container in containers:
                     # Find article elements inside these containers using different class patterns
-                    for tag in ['div', 'li', 'article']:
-                        for class_name in ['item', 'story', 'article', 'news', 'result']:
-                            items = container.find_all(tag, class_=class_name)
-                            stories.extend(items)
+                    stories.extend(find_all_by_tag_and_class(container, ['div', 'li', 'article'], ['item', 'story', 'article', 'news', 'result']))
                 
                 story_cards = stories
                 logger.info(f"Found {len(story_cards)} potential articles using container approach")
@@ -1002,17 +1325,12 @@ def scrape_india_today():
             
             # APPROACH 4: Look specifically for search results on search pages
             if "search-result" in url and (not story_cards or len(story_cards) < 3):
-                search_results = []
-                
-                # Look for search result containers
-                for tag in ['div', 'article']:
-                    # Look for classes containing 'search-result'
-                    for result in soup.find_all(tag):
-                        if result.has_attr('class'):
-                            for class_name in result['class']:
-                                if 'search-result' in class_name.lower():
-                                    search_results.append(result)
-                                    break
+                # Look for search result containers with classes containing 'search-result'
+                search_results = find_all_grouped_by_tag(
+                    soup,
+                    ['div', 'article'],
+                    lambda class_name: 'search-result' in class_name.lower()
+                )
                 
                 if search_results:
                     story_cards = search_results
@@ -1075,8 +1393,7 @@ def scrape_india_today():
                         continue
                     
                     # Make URL absolute if it's relative
-                    if not article_url.startswith('http'):
-                        article_url = "https://www.indiatoday.in" + (article_url if article_url.startswith('/') else '/' + article_url)
+                    article_url = urljoin("https://www.indiatoday.in", article_url)
                     
                     # Extract date
                     date_text = ""
@@ -1100,64 +1417,60 @@ def scrape_india_today():
                         text_elements = article.find_all(['span', 'p', 'div', 'time'])
                         for elem in text_elements:
                             text = elem.get_text(strip=True)
-                            if re.search(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b', text):
+                            if BOUNDED_NUMERIC_OR_MONTH_DATE_PATTERN.search(text):
                                 date_text = text
                                 break
                     
                     # Parse date from the extracted text
                     date = extract_date(date_text, datetime.date.today())
                     
-                    # Extract article content using trafilatura
-                    logger.info(f"Extracting content from India Today article: {article_url}")
-                    content = extract_content_with_trafilatura(article_url)
+                    # Use a summary or description as content if the article text can't be fetched
+                    summary_elem = None
                     
-                    # If content extraction failed, look for summary or description
-                    if not content:
-                        summary_elem = None
-                        
-                        # Look for summary elements with specific classes
-                        for tag in ['p', 'div']:
-                            for class_name in ['summary', 'desc', 'intro', 'detail', 'teaser']:
-                                found = article.find(tag, class_=class_name)
-                                if found:
-                                    summary_elem = found
-                                    break
-                            if summary_elem:
+                    # Look for summary elements with specific classes
+                    for tag in ['p', 'div']:
+                        for class_name in ['summary', 'desc', 'intro', 'detail', 'teaser']:
+                            found = article.find(tag, class_=class_name)
+                            if found:
+                                summary_elem = found
                                 break
-                        
                         if summary_elem:
-                            content = summary_elem.get_text(strip=True)
-                            logger.info(f"Using summary as content: {content[:50]}...")
-                        else:
-                            # Use title as fallback
-                            content = title
-                            logger.info("Using title as content fallback")
+                            break
                     
-                    # Check if the article is cybersecurity-related
-                    combined_text = (title + " " + (content or "")).lower()
-                    cybersec_terms = [
-                        'cyber', 'hack', 'security', 'breach', 'malware', 'ransomware', 
-                        'phishing', 'data leak', 'attack', 'vulnerability', 'threat',
-                        'privacy', 'encryption', 'firewall', 'authentication', 'data protection',
-                        'virus', 'trojan', 'spyware', 'password', 'intrusion'
-                    ]
+                    # Use title as fallback
+                    content = summary_elem.get_text(strip=True) if summary_elem else title
                     
-                    if any(term.lower() in combined_text for term in cybersec_terms):
-                        news_items.append({
-                            'headline': title,
-                            'date': date,
-                            'content': content or title,
-                            'source': 'India Today',
-                            'url': article_url
-                        })
-                        logger.info(f"Added India Today article: {title[:40]}...")
-                    else:
-                        logger.info(f"Skipping non-cybersecurity article: {title[:40]}...")
+                    news_item = {
+                        'headline': title,
+                        'date': date,
+                        'content': content or title,
+                        'source': 'India Today',
+                        'url': article_url
+                    }
+                    if add_news_item(candidates_by_headline, news_item):
+                        candidate_items.append(news_item)
                 
                 except Exception as e:
                     logger.error(f"Error processing India Today article: {str(e)}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+                    logger.debug("Traceback:", exc_info=True)
+            
+            fetch_article_contents(candidate_items)
+            
+            # Check if each article is cybersecurity-related
+            cybersec_terms = [
+                'cyber', 'hack', 'security', 'breach', 'malware', 'ransomware', 
+                'phishing', 'data leak', 'attack', 'vulnerability', 'threat',
+                'privacy', 'encryption', 'firewall', 'authentication', 'data protection',
+                'virus', 'trojan', 'spyware', 'password', 'intrusion'
+            ]
+            
+            for item in candidate_items:
+                combined_text = (item['headline'] + " " + item['content']).lower()
+                if any(term in combined_text for term in cybersec_terms):
+                    news_items.append(item)
+                    logger.info(f"Added India Today article: {item['headline'][:40]}...")
+                else:
+                    logger.info(f"Skipping non-cybersecurity article: {item['headline'][:40]}...")
             
             # Add this URL's items to our collection
             logger.info(f"Found {len(news_items)} cybersecurity articles from India Today URL: {url}")
@@ -1183,59 +1496,43 @@ def scrape_i4c():
         "https://www.i4c.gov.in/news.html"
     ]
     
-    all_news_items = []
+    all_news_items = OrderedDict()
     
-    # Fallback items for I4C to ensure we always have data
-    fallback_items = [
-        {
-            'headline': "Awareness Campaign Against Cybercrime",
-            'date': datetime.date.today(),
-            'content': "I4C has launched an awareness campaign to educate citizens on recognizing and avoiding common cyber frauds, including OTP fraud, KYC fraud, and investment scams.",
-            'source': 'I4C',
-            'url': "https://cybercrime.gov.in/"
-        },
-        {
-            'headline': "I4C Advisory on Online Financial Frauds",
-            'date': datetime.date.today(),
-            'content': "I4C warns citizens against sharing OTPs, bank details, or clicking on suspicious links. Report cyber financial crimes at cybercrime.gov.in or call 1930 helpline.",
-            'source': 'I4C',
-            'url': "https://cybercrime.gov.in/"
-        }
-    ]
+    # Items whose content is filled in from their article pages after parsing
+    pending_content_items = []
     
     for url in urls:
         logger.info(f"Trying I4C URL: {url}")
         try:
-            # Use more browser-like headers to avoid blocking
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
             # Government websites can be slow, use a longer timeout
-            response = requests.get(url, headers=headers, timeout=30, verify=False)
+            wait_for_rate_limit(url)
+            response = HTTP_SESSION.get(url, headers=I4C_HEADERS, timeout=30, verify=False, stream=True)
             
             if response.status_code != 200:
                 logger.warning(f"Failed to retrieve I4C page from {url} - Status code: {response.status_code}")
+                response.close()
+                continue
+            
+            # Skip pages the server says are very small without downloading them
+            advertised_size = advertised_page_size(response)
+            if advertised_size is not None and advertised_size < MIN_PAGE_SIZE:
+                logger.warning(f"I4C page from {url} is too small ({advertised_size} bytes), skipping")
+                response.close()
                 continue
                 
             content_size = len(response.content)
             logger.info(f"Successfully retrieved I4C page from {url} - Size: {content_size} bytes")
             
             # Skip very small responses which are likely error pages
-            if content_size < 300:
+            if content_size < MIN_PAGE_SIZE:
                 logger.warning(f"I4C page from {url} is too small ({content_size} bytes), skipping")
                 continue
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # APPROACH 1: Direct search for cybersecurity advisories and alerts
             # I4C often posts PDF advisories
-            pdf_links = soup.find_all('a', href=lambda href: href and ('.pdf' in href.lower() or 'advisory' in href.lower() or 'alert' in href.lower()))
+            pdf_links = soup.find_all('a', href=I4C_LINK_PATTERN)
             logger.info(f"Found {len(pdf_links)} PDF/advisory links")
             
             for link in pdf_links:
@@ -1257,17 +1554,15 @@ def scrape_i4c():
                     
                     # Extract URL
                     article_url = link['href']
-                    if not article_url.startswith('http'):
-                        base_url = urlparse(url).scheme + "://" + urlparse(url).netloc
-                        article_url = base_url + "/" + article_url.lstrip('/')
+                    article_url = urljoin(url, article_url)
                     
                     # Try to extract date from filename or text
                     date_text = ""
-                    date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', title)
+                    date_match = NUMERIC_DATE_PATTERN.search(title)
                     if date_match:
                         date_text = date_match.group(0)
                     else:
-                        date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', article_url)
+                        date_match = NUMERIC_DATE_PATTERN.search(article_url)
                         if date_match:
                             date_text = date_match.group(0)
                     
@@ -1276,7 +1571,7 @@ def scrape_i4c():
                     # We can't extract content from PDFs easily, so use title
                     content = f"I4C Advisory: {title}"
                     
-                    all_news_items.append({
+                    add_news_item(all_news_items, {
                         'headline': title,
                         'date': date,
                         'content': content,
@@ -1297,7 +1592,7 @@ def scrape_i4c():
                     logger.info(f"Processing table with {len(rows)} rows")
                     for row in rows[1:]:  # Skip header row
                         try:
-                            cells = row.find_all('td')
+                            cells = row.find_all('td', recursive=False)
                             if len(cells) >= 2:
                                 # First cell typically contains date, second contains title/content
                                 date_text = cells[0].get_text(strip=True)
@@ -1311,29 +1606,23 @@ def scrape_i4c():
                                 link = cells[1].find('a')
                                 if link and link.has_attr('href'):
                                     article_url = link['href']
-                                    if article_url and not article_url.startswith('http'):
-                                        base_url = urlparse(url).scheme + "://" + urlparse(url).netloc
-                                        article_url = base_url + "/" + article_url.lstrip('/')
+                                    if article_url:
+                                        article_url = urljoin(url, article_url)
                                 
                                 # Extract date
                                 date = extract_date(date_text, datetime.date.today())
                                 
                                 # Try to get content if there's a URL
-                                content = ""
-                                if article_url:
-                                    content = extract_content_with_trafilatura(article_url)
-                                
-                                # Use title as fallback content
-                                if not content:
-                                    content = title
-                                
-                                all_news_items.append({
+                                # Use title as content until the article text is fetched
+                                news_item = {
                                     'headline': title,
                                     'date': date,
-                                    'content': content,
+                                    'content': title,
                                     'source': 'I4C',
                                     'url': article_url
-                                })
+                                }
+                                if add_news_item(all_news_items, news_item) and article_url:
+                                    pending_content_items.append(news_item)
                                 logger.info(f"Added I4C news item: {title[:40]}...")
                         except Exception as e:
                             logger.error(f"Error processing I4C table row: {str(e)}")
@@ -1371,12 +1660,12 @@ def scrape_i4c():
             
             logger.info(f"Found {len(news_divs)} potential news containers")
             
+            # Items whose content is fetched before they are checked for cybersecurity terms
+            candidate_items = []
+            
             for news_div in news_divs:
                 # Try to find list items, links, or paragraphs
-                items = []
-                for tag in ['li', 'a', 'p', 'div']:
-                    found_items = news_div.find_all(tag)
-                    items.extend(found_items)
+                items = news_div.find_all(['li', 'a', 'p', 'div'])
                 
                 for item in items:
                     try:
@@ -1398,9 +1687,8 @@ def scrape_i4c():
                             if link and link.has_attr('href'):
                                 article_url = link['href']
                         
-                        if article_url and not article_url.startswith('http'):
-                            base_url = urlparse(url).scheme + "://" + urlparse(url).netloc
-                            article_url = base_url + "/" + article_url.lstrip('/')
+                        if article_url:
+                            article_url = urljoin(url, article_url)
                         
                         # Extract date
                         date_text = ""
@@ -1409,36 +1697,32 @@ def scrape_i4c():
                             date_text = date_elem.get_text(strip=True)
                         else:
                             # Try to extract date from the title or content
-                            date_match = re.search(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b', title)
+                            date_match = BOUNDED_NUMERIC_DATE_PATTERN.search(title)
                             if date_match:
                                 date_text = date_match.group(0)
                         
                         date = extract_date(date_text, datetime.date.today())
                         
-                        # Get content if URL is available
-                        content = ""
-                        if article_url:
-                            content = extract_content_with_trafilatura(article_url)
-                        
-                        if not content:
-                            content = title
-                        
-                        # Skip non-cybersecurity content
-                        combined_text = (title + " " + content).lower()
-                        if not any(term in combined_text for term in ['cyber', 'security', 'hack', 'phish', 'fraud', 'scam', 'attack', 'threat', 'malware']):
-                            continue
-                        
-                        all_news_items.append({
+                        # Use title as content if the article text can't be fetched
+                        candidate_items.append({
                             'headline': title,
                             'date': date,
-                            'content': content,
+                            'content': title,
                             'source': 'I4C',
                             'url': article_url
                         })
-                        logger.info(f"Added I4C news item from div: {title[:40]}...")
                     except Exception as e:
                         logger.error(f"Error processing I4C div item: {str(e)}")
             
+            fetch_article_contents(candidate_items)
+            
+            # Skip non-cybersecurity content
+            for item in candidate_items:
+                combined_text = (item['headline'] + " " + item['content']).lower()
+                if any(term in combined_text for term in ['cyber', 'security', 'hack', 'phish', 'fraud', 'scam', 'attack', 'threat', 'malware']):
+                    add_news_item(all_news_items, item)
+                    logger.info(f"Added I4C news item from div: {item['headline'][:40]}...")
+            
             # APPROACH 4: Scan all links on the page for cybersecurity content
             if len(all_news_items) < 3:  # If we still don't have enough items
                 logger.info("Looking for cybersecurity-related links across entire page")
@@ -1459,32 +1743,26 @@ def scrape_i4c():
                         # Check if text or URL contains cyber terms
                         if any(term in text.lower() for term in cyber_terms) or any(term in href for term in cyber_terms):
                             article_url = link['href']
-                            if not article_url.startswith('http'):
-                                base_url = urlparse(url).scheme + "://" + urlparse(url).netloc
-                                article_url = base_url + "/" + article_url.lstrip('/')
+                            article_url = urljoin(url, article_url)
                             
                             # Extract date if present in the text
                             date_text = ""
-                            date_match = re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text)
+                            date_match = NUMERIC_DATE_PATTERN.search(text)
                             if date_match:
                                 date_text = date_match.group(0)
                             
                             date = extract_date(date_text, datetime.date.today())
                             
-                            # Get content if URL is available
-                            content = extract_content_with_trafilatura(article_url) if article_url else ""
-                            
-                            # Use text as fallback if no content
-                            if not content:
-                                content = text
-                            
-                            all_news_items.append({
+                            # Use text as content until the article text is fetched
+                            news_item = {
                                 'headline': text,
                                 'date': date,
-                                'content': content,
+                                'content': text,
                                 'source': 'I4C',
                                 'url': article_url
-                            })
+                            }
+                            if add_news_item(all_news_items, news_item) and article_url:
+                                pending_content_items.append(news_item)
                             logger.info(f"Added I4C cybersecurity link: {text[:40]}...")
                     except Exception as e:
                         logger.error(f"Error processing I4C cybersecurity link: {str(e)}")
@@ -1497,18 +1775,16 @@ def scrape_i4c():
         except Exception as e:
             logger.error(f"Error scraping I4C from {url}: {str(e)}")
     
+    fetch_article_contents(pending_content_items)
+    
     # If we couldn't find any items, use the fallback data
     if not all_news_items:
         logger.warning("Could not retrieve any I4C items, using fallback data")
-        all_news_items = fallback_items
+        for item in fallback_news_items('I4C'):
+            add_news_item(all_news_items, item)
     
-    # Remove duplicates
-    unique_items = []
-    seen_titles = set()
-    for item in all_news_items:
-        if item['headline'] not in seen_titles:
-            seen_titles.add(item['headline'])
-            unique_items.append(item)
+    # Items were deduplicated by headline as they were added
+    unique_items = list(all_news_items.values())
     
     logger.info(f"Scraped {len(unique_items)} unique items from I4C")
     return unique_items
@@ -1523,7 +1799,7 @@ def scrape_inc42():
         logger.error("Failed to retrieve Inc42 page")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = make_soup(response.content)
     news_items = []
     
     try:
@@ -1559,17 +1835,9 @@ def scrape_inc42():
                 
                 date = extract_date(date_text, datetime.date.today())
                 
-                # Extract content
-                content = ""
-                if url:
-                    content = extract_content_with_trafilatura(url)
-                
-                if not content:
-                    excerpt_elem = article.find(['p', 'div'], class_=['excerpt', 'summary', 'description'])
-                    if excerpt_elem:
-                        content = excerpt_elem.get_text(strip=True)
-                    else:
-                        content = title
+                # Use the excerpt or title as content until the article text is fetched
+                excerpt_elem = article.find(['p', 'div'], class_=['excerpt', 'summary', 'description'])
+                content = excerpt_elem.get_text(strip=True) if excerpt_elem else title
                 
                 news_items.append({
                     'headline': title,
@@ -1583,6 +1851,8 @@ def scrape_inc42():
     except Exception as e:
         logger.error(f"Error scraping Inc42: {str(e)}")
     
+    fetch_article_contents(news_items)
+    
     logger.info(f"Scraped {len(news_items)} items from Inc42")
     return news_items
 
@@ -1596,7 +1866,7 @@ def scrape_economic_times():
         logger.error("Failed to retrieve Economic Times page")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = make_soup(response.content)
     news_items = []
     
     try:
@@ -1627,8 +1897,8 @@ def scrape_economic_times():
                     if link and link.has_attr('href'):
                         url = link['href']
                 
-                if url and not url.startswith('http'):
-                    url = "https://economictimes.indiatimes.com" + url
+                if url:
+                    url = urljoin("https://economictimes.indiatimes.com", url)
                 
                 # Extract date
                 date_elem = article.find(['time', 'span', 'p'], class_=['date-format', 'date', 'time'])
@@ -1638,17 +1908,9 @@ def scrape_economic_times():
                 
                 date = extract_date(date_text, datetime.date.today())
                 
-                # Extract content
-                content = ""
-                if url:
-                    content = extract_content_with_trafilatura(url)
-                
-                if not content:
-                    summary_elem = article.find(['p', 'div'], class_=['summary', 'desc'])
-                    if summary_elem:
-                        content = summary_elem.get_text(strip=True)
-                    else:
-                        content = title
+                # Use the summary or title as content until the article text is fetched
+                summary_elem = article.find(['p', 'div'], class_=['summary', 'desc'])
+                content = summary_elem.get_text(strip=True) if summary_elem else title
                 
                 news_items.append({
                     'headline': title,
@@ -1662,6 +1924,8 @@ def scrape_economic_times():
     except Exception as e:
         logger.error(f"Error scraping Economic Times: {str(e)}")
     
+    fetch_article_contents(news_items)
+    
     logger.info(f"Scraped {len(news_items)} items from Economic Times")
     return news_items
 
@@ -1675,7 +1939,7 @@ def scrape_indian_express():
         logger.error("Failed to retrieve Indian Express page")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = make_soup(response.content)
     news_items = []
     
     try:
@@ -1714,8 +1978,8 @@ def scrape_indian_express():
                     if link and link.has_attr('href'):
                         url = link['href']
                 
-                if url and not url.startswith('http'):
-                    url = "https://indianexpress.com" + url
+                if url:
+                    url = urljoin("https://indianexpress.com", url)
                 
                 # Extract date
                 date_elem = article.find(['span', 'div'], class_=['date'])
@@ -1725,17 +1989,11 @@ def scrape_indian_express():
                 
                 date = extract_date(date_text, datetime.date.today())
                 
-                # Extract content
-                content = ""
-                if url:
-                    content = extract_content_with_trafilatura(url) or headline
-                else:
-                    content = headline
-                
+                # Content falls back to the headline until the article text is fetched
                 news_items.append({
                     'headline': headline,
                     'date': date,
-                    'content': content,
+                    'content': headline,
                     'source': 'Indian Express',
                     'url': url
                 })
@@ -1744,6 +2002,8 @@ def scrape_indian_express():
     except Exception as e:
         logger.error(f"Error scraping Indian Express: {str(e)}")
     
+    fetch_article_contents(news_items)
+    
     logger.info(f"Scraped {len(news_items)} items from Indian Express")
     return news_items
 
@@ -1757,43 +2017,29 @@ def scrape_news18():
         logger.error("Failed to retrieve News18 page")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = make_soup(response.content)
     news_items = []
     
+    # Articles whose content is fetched before they are checked for cybersecurity terms
+    candidate_items = []
+    
     try:
         # Log HTML size for debugging
-        logger.info(f"News18 page retrieved: {len(str(soup))} characters")
+        logger.info(f"News18 page retrieved: {len(response.content)} bytes")
         
         # APPROACH 1: Look for articles directly - using more specific selectors for News18
         # News18 uses div with class="jsx-XXX" patterns for articles
-        article_containers = []
-        
         # Find div with jsx- prefix in class names
-        for div in soup.find_all('div'):
-            if div.has_attr('class'):
-                for class_name in div['class']:
-                    if class_name.startswith('jsx-'):
-                        article_containers.append(div)
-                        break
-                        
+        article_containers = find_all_grouped_by_tag(soup, ['div'], lambda class_name: class_name.startswith('jsx-'))
+        
         articles = [div for div in article_containers if div.find('h4') or div.find('h3')]
         logger.info(f"Found {len(articles)} potential articles using jsx approach")
         
         # APPROACH 2: If above doesn't work, try finding article cards with images and headings
         if not articles:
             # Look for article cards
-            card_articles = []
-            
             # Find elements with card or list-item in class names
-            for tag in ['li', 'article', 'div']:
-                for elem in soup.find_all(tag):
-                    if elem.has_attr('class'):
-                        for class_name in elem['class']:
-                            if 'card' in class_name or 'list-item' in class_name:
-                                card_articles.append(elem)
-                                break
-            
-            articles = card_articles
+            articles = find_all_grouped_by_tag(soup, ['li', 'article', 'div'], class_contains(['card', 'list-item']))
             logger.info(f"Found {len(articles)} potential articles using card/list-item approach")
         
         # APPROACH 3: If all else fails, look for any heading with a cyber-related link
@@ -1874,8 +2120,8 @@ def scrape_news18():
                     continue
                 
                 # Normalize URL
-                if url and not url.startswith('http'):
-                    url = "https://www.news18.com" + (url if url.startswith('/') else '/' + url)
+                if url:
+                    url = urljoin("https://www.news18.com", url)
                 
                 # Skip if URL is missing
                 if not url:
@@ -1900,29 +2146,25 @@ def scrape_news18():
                 
                 date = extract_date(date_text, datetime.date.today())
                 
-                # Extract content using trafilatura
-                content = ""
-                if url:
-                    logger.info(f"Extracting content from News18 article: {url}")
-                    content = extract_content_with_trafilatura(url)
-                    if not content:
-                        logger.warning(f"Could not extract content from {url} with trafilatura")
-                        content = headline
-                
-                # Only include articles with cybersecurity terms
-                if any(term in (content + headline).lower() for term in ['cyber', 'security', 'hack', 'breach', 'attack', 'data', 'privacy']):
-                    news_items.append({
-                        'headline': headline,
-                        'date': date,
-                        'content': content or headline,
-                        'source': 'News18',
-                        'url': url
-                    })
-                    logger.info(f"Added News18 article: {headline[:40]}...")
+                # Content falls back to the headline if the article text can't be fetched
+                candidate_items.append({
+                    'headline': headline,
+                    'date': date,
+                    'content': headline,
+                    'source': 'News18',
+                    'url': url
+                })
             except Exception as e:
                 logger.error(f"Error processing News18 article: {str(e)}")
-                import traceback
-                logger.error(traceback.format_exc())
+                logger.debug("Traceback:", exc_info=True)
+        
+        fetch_article_contents(candidate_items)
+        
+        # Only include articles with cybersecurity terms
+        for item in candidate_items:
+            if any(term in (item['content'] + item['headline']).lower() for term in ['cyber', 'security', 'hack', 'breach', 'attack', 'data', 'privacy']):
+                news_items.append(item)
+                logger.info(f"Added News18 article: {item['headline'][:40]}...")
     except Exception as e:
         logger.error(f"Error scraping News18: {str(e)}")
         import traceback
@@ -1931,13 +2173,12 @@ def scrape_news18():
     logger.info(f"Scraped {len(news_items)} items from News18")
     return news_items
 
-def scrape_all_sources():
-    """Scrape all defined cybersecurity news sources with priority for government sources"""
-    all_news = []
-    
-    # Define scraping functions for each source with official government sources first
-    # This also determines the order of scraping
-    scraping_functions = OrderedDict([
+def get_scraping_functions():
+    """
+    Return the scraping function for each source with official government sources first.
+    This also determines the order of the scraped results.
+    """
+    return OrderedDict([
         # Priority 1: Official Government Sources
         ("CERT-In", scrape_cert_in),
         ("NCIIPC", scrape_nciipc),
@@ -1953,35 +2194,63 @@ def scrape_all_sources():
         ("News18", scrape_news18),
         ("Inc42", scrape_inc42)
     ])
+
+def scrape_source(source_name, scrape_func):
+    """Run a single source's scraping function and tag its items with the source name"""
+    try:
+        logger.info(f"Starting to scrape {source_name} with {scrape_func.__name__}")
+        news_items = scrape_func()
+        
+        if news_items and len(news_items) > 0:
+            logger.info(f"Successfully scraped {len(news_items)} items from {source_name}")
+            
+            # Make sure all items have the exact matching source name
+            for item in news_items:
+                item['source'] = source_name
+            
+            return news_items
+        
+        logger.warning(f"No items scraped from {source_name}")
+        return []
+    except Exception as e:
+        logger.error(f"Error in {scrape_func.__name__}: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return []
+
+async def scrape_all_sources_async(progress_callback=None):
+    """
+    Scrape all defined cybersecurity news sources concurrently.
+    Each source's (blocking) scraper runs in a worker thread, with at most
+    MAX_CONCURRENT_SOURCES running at once. Results keep the source priority order.
+    progress_callback(source_name, item_count) is called as each source finishes.
+    """
+    scraping_functions = get_scraping_functions()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+    loop = asyncio.get_running_loop()
+    
+    # Dedicated pool so the default executor's size doesn't cap concurrency
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SOURCES) as executor:
+        async def run_scraper(source_name, scrape_func):
+            async with semaphore:
+                news_items = await loop.run_in_executor(executor, scrape_source, source_name, scrape_func)
+            
+            if progress_callback:
+                progress_callback(source_name, len(news_items))
+            
+            return news_items
+        
+        results = await asyncio.gather(*(
+            run_scraper(source_name, scrape_func) for source_name, scrape_func in scraping_functions.items()
+        ))
     
-    # Run all scraping functions and collect results
-    scraped_items = []
+    all_news = []
     failed_sources = []
     
-    for source_name, scrape_func in scraping_functions.items():
-        try:
-            logger.info(f"Starting to scrape {source_name} with {scrape_func.__name__}")
-            news_items = scrape_func()
-            
-            if news_items and len(news_items) > 0:
-                logger.info(f"Successfully scraped {len(news_items)} items from {source_name}")
-                
-                # Make sure all items have the exact matching source name
-                for item in news_items:
-                    item['source'] = source_name
-                
-                scraped_items.extend(news_items)
-                all_news.extend(news_items)
-            else:
-                logger.warning(f"No items scraped from {source_name}")
-                failed_sources.append(source_name)
-                
-            # Add delay between requests to different sources
-            time.sleep(random.uniform(1, 3))
-        except Exception as e:
-            logger.error(f"Error in {scrape_func.__name__}: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+    for source_name, news_items in zip(scraping_functions.keys(), results):
+        if news_items:
+            all_news.extend(news_items)
+        else:
             failed_sources.append(source_name)
     
     # Log results for each source
@@ -1996,6 +2265,10 @@ def scrape_all_sources():
     
     return all_news
 
+def scrape_all_sources():
+    """Scrape all defined cybersecurity news sources with priority for government sources"""
+    return asyncio.run(scrape_all_sources_async())
+
 def scrape_nasscom():
     """Scrape cybersecurity news from NASSCOM"""
     logger.info("Scraping NASSCOM - Cybersecurity")
@@ -2008,74 +2281,48 @@ def scrape_nasscom():
         "https://nasscom.in/latest-from-nasscom/news"
     ]
     
-    all_news_items = []
-    
-    # Fallback items for NASSCOM to ensure we always have data
-    fallback_items = [
-        {
-            'headline': "NASSCOM's Cybersecurity Task Force Report",
-            'date': datetime.date.today(),
-            'content': "The NASSCOM Cybersecurity Task Force has published guidelines on security best practices for Indian IT companies, emphasizing the need for enhanced protection of critical infrastructure.",
-            'source': 'NASSCOM',
-            'url': "https://nasscom.in/topics/cyber-security"
-        },
-        {
-            'headline': "NASSCOM Partners with Government on Cybersecurity Skilling Initiative",
-            'date': datetime.date.today(),
-            'content': "NASSCOM has announced a partnership with the Indian government to train 100,000 professionals in cybersecurity skills by 2025, addressing the growing demand for security expertise in the IT industry.",
-            'source': 'NASSCOM',
-            'url': "https://nasscom.in/topics/cyber-security"
-        }
-    ]
+    all_news_items = OrderedDict()
     
     for url in urls:
         logger.info(f"Trying NASSCOM URL: {url}")
         try:
-            # Enhanced browser-like headers
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://www.google.com/',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'no-cache',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
             # Increased timeout for reliability
-            response = requests.get(url, headers=headers, timeout=30, verify=False)
+            wait_for_rate_limit(url)
+            response = HTTP_SESSION.get(url, headers=NASSCOM_HEADERS, timeout=30, verify=False, stream=True)
             
             if response.status_code != 200:
                 logger.warning(f"Failed to retrieve NASSCOM page from {url} - Status code: {response.status_code}")
+                response.close()
+                continue
+            
+            # Skip pages the server says are very small without downloading them
+            advertised_size = advertised_page_size(response)
+            if advertised_size is not None and advertised_size < MIN_PAGE_SIZE:
+                logger.warning(f"NASSCOM page from {url} is too small ({advertised_size} bytes), skipping")
+                response.close()
                 continue
                 
             content_size = len(response.content)
             logger.info(f"Successfully retrieved NASSCOM page from {url} - Size: {content_size} bytes")
             
             # Skip very small responses which are likely error pages
-            if content_size < 300:
+            if content_size < MIN_PAGE_SIZE:
                 logger.warning(f"NASSCOM page from {url} is too small ({content_size} bytes), skipping")
                 continue
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # APPROACH 1: Look for Drupal-style articles (NASSCOM uses Drupal)
             articles = []
             
             # Look for common Drupal content patterns
-            for tag in ['article', 'div']:
-                for class_name in ['node', 'article', 'teaser', 'views-row', 'field-content']:
-                    found_articles = soup.find_all(tag, class_=class_name)
-                    articles.extend(found_articles)
-                    logger.info(f"Found {len(found_articles)} {tag} elements with class {class_name}")
+            articles.extend(find_all_by_tag_and_class(soup, ['article', 'div'], ['node', 'article', 'teaser', 'views-row', 'field-content']))
+            logger.info(f"Found {len(articles)} elements with Drupal content classes")
             
             # APPROACH 2: Try more general content patterns if no Drupal patterns found
             if not articles:
                 # Look for cards, items, or content blocks
-                for tag in ['div']:
-                    for class_name in ['card', 'item', 'listing-item', 'content-block', 'post']:
-                        found_articles = soup.find_all(tag, class_=class_name)
-                        articles.extend(found_articles)
+                articles.extend(find_all_by_tag_and_class(soup, ['div'], ['card', 'item', 'listing-item', 'content-block', 'post']))
                 
                 logger.info(f"Found {len(articles)} potential content blocks")
             
@@ -2106,6 +2353,9 @@ def scrape_nasscom():
             
             logger.info(f"Processing {len(articles)} potential articles/sections")
             
+            # Articles whose content is fetched before they are checked for cybersecurity terms
+            candidate_items = []
+            
             for article in articles:
                 try:
                     # Find title element
@@ -2131,8 +2381,8 @@ def scrape_nasscom():
                             article_url = link['href']
                     
                     # Make absolute URL if relative
-                    if article_url and not article_url.startswith('http'):
-                        article_url = "https://nasscom.in" + ('' if article_url.startswith('/') else '/') + article_url
+                    if article_url:
+                        article_url = urljoin("https://nasscom.in", article_url)
                     
                     # Extract date
                     date_text = ""
@@ -2140,7 +2390,7 @@ def scrape_nasscom():
                         # Look for common date classes
                         (article.find(['span', 'div', 'time'], class_=['date', 'created', 'datetime', 'meta'])),
                         # Look for date text patterns in paragraphs
-                        (article.find(['p', 'div'], text=re.compile(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}')))
+                        (article.find(['p', 'div'], text=NUMERIC_DATE_PATTERN))
                     ]
                     
                     for pattern in date_patterns:
@@ -2150,49 +2400,48 @@ def scrape_nasscom():
                     
                     # If no date found, try regex in the whole article text
                     if not date_text:
-                        date_match = re.search(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b', article.get_text())
+                        date_match = BOUNDED_NUMERIC_DATE_PATTERN.search(article.get_text())
                         if date_match:
                             date_text = date_match.group(0)
                     
                     date = extract_date(date_text, datetime.date.today())
                     
-                    # Extract content
+                    # Extract content from the summary, used if the article text can't be fetched
                     content = ""
                     
-                    # Try to get full article content if URL available
-                    if article_url:
-                        content = extract_content_with_trafilatura(article_url)
-                    
-                    # If no content from URL, try to extract from summary
-                    if not content:
-                        # Look for summary, teaser, or field classes
-                        summary_elem = article.find(['div', 'span', 'p'], class_=['summary', 'teaser', 'field-item', 'field--item', 'abstract'])
-                        if summary_elem:
-                            content = summary_elem.get_text(strip=True)
-                        else:
-                            # Get all paragraphs in the article
-                            paragraphs = article.find_all('p')
-                            if paragraphs:
-                                content = ' '.join([p.get_text(strip=True) for p in paragraphs])
+                    # Look for summary, teaser, or field classes
+                    summary_elem = article.find(['div', 'span', 'p'], class_=['summary', 'teaser', 'field-item', 'field--item', 'abstract'])
+                    if summary_elem:
+                        content = summary_elem.get_text(strip=True)
+                    else:
+                        # Get all paragraphs in the article
+                        paragraphs = article.find_all('p')
+                        if paragraphs:
+                            content = ' '.join([p.get_text(strip=True) for p in paragraphs])
                     
                     # Use title as fallback content
                     if not content:
                         content = title
                     
-                    # Only add if title or content has cybersecurity terms
-                    combined_text = (title + " " + content).lower()
-                    if any(term in combined_text for term in ['cyber', 'security', 'hack', 'breach', 'attack', 'malware', 'phishing', 'threat', 'vulnerability']):
-                        all_news_items.append({
-                            'headline': title,
-                            'date': date,
-                            'content': content,
-                            'source': 'NASSCOM',
-                            'url': article_url
-                        })
-                        logger.info(f"Added NASSCOM news item: {title[:40]}...")
+                    candidate_items.append({
+                        'headline': title,
+                        'date': date,
+                        'content': content,
+                        'source': 'NASSCOM',
+                        'url': article_url
+                    })
                 except Exception as e:
                     logger.error(f"Error processing NASSCOM article: {str(e)}")
             
+            fetch_article_contents(candidate_items)
+            
+            # Only add if title or content has cybersecurity terms
+            for item in candidate_items:
+                combined_text = (item['headline'] + " " + item['content']).lower()
+                if any(term in combined_text for term in ['cyber', 'security', 'hack', 'breach', 'attack', 'malware', 'phishing', 'threat', 'vulnerability']):
+                    add_news_item(all_news_items, item)
+                    logger.info(f"Added NASSCOM news item: {item['headline'][:40]}...")
+            
             # If we found items, we can stop trying other URLs
             if len(all_news_items) >= 3:
                 logger.info(f"Successfully scraped {len(all_news_items)} items from {url}")
@@ -2204,15 +2453,11 @@ def scrape_nasscom():
     # If we couldn't find any items, use the fallback data
     if not all_news_items:
         logger.warning("Could not retrieve any NASSCOM items, using fallback data")
-        all_news_items = fallback_items
-    
-    # Remove duplicates
-    unique_items = []
-    seen_titles = set()
-    for item in all_news_items:
-        if item['headline'] not in seen_titles:
-            seen_titles.add(item['headline'])
-            unique_items.append(item)
+        for item in fallback_news_items('NASSCOM'):
+            add_news_item(all_news_items, item)
+    
+    # Items were deduplicated by headline as they were added
+    unique_items = list(all_news_items.values())
     
     logger.info(f"Scraped {len(unique_items)} unique items from NASSCOM")
     return unique_items
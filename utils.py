@@ -9,6 +9,10 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Scraped news is saved as Parquet; older versions (and the bundled sample data) used CSV
+DATA_FILE = "cybersecurity_news.parquet"
+LEGACY_DATA_FILE = "cybersecurity_news.csv"
+
 def filter_dataframe(df, sources=None, date_range=None, search_term=None):
     """
     Filter DataFrame based on selected sources, date range, and search term.
@@ -22,11 +26,12 @@ def filter_dataframe(df, sources=None, date_range=None, search_term=None):
     Returns:
         Filtered DataFrame
     """
-    filtered_df = df.copy()
+    # Build one boolean mask over the whole frame and select the rows once at the end
+    mask = pd.Series(True, index=df.index)
     
-    # Filter by source
+    # Filter by source (isin on a categorical column only compares the integer codes)
     if sources and len(sources) > 0:
-        filtered_df = filtered_df[filtered_df['source'].isin(sources)]
+        mask &= df['source'].isin(set(sources))
     
     # Filter by date range
     if date_range and len(date_range) == 2:
@@ -34,29 +39,24 @@ def filter_dataframe(df, sources=None, date_range=None, search_term=None):
             start_date, end_date = date_range
             
             # Make sure the dates in DataFrame are datetime objects
-            if not pd.api.types.is_datetime64_any_dtype(filtered_df['date']):
-                filtered_df['date'] = pd.to_datetime(filtered_df['date'])
+            if not pd.api.types.is_datetime64_any_dtype(df['date']):
+                df = df.assign(date=pd.to_datetime(df['date']))
             
             # Convert input dates to Timestamps for comparison
             start_date_ts = pd.Timestamp(start_date)
             end_date_ts = pd.Timestamp(end_date)
             
             # Filter by date range
-            filtered_df = filtered_df[
-                (filtered_df['date'] >= start_date_ts) &
-                (filtered_df['date'] <= end_date_ts)
-            ]
+            mask &= df['date'].between(start_date_ts, end_date_ts)
         except Exception as e:
             logger.error(f"Error filtering by date range: {str(e)}")
             # Skip date filtering if there's an error
     
-    # Filter by search term
+    # Filter by search term (plain substring match, so characters like "(" or "." are literal)
     if search_term and search_term.strip():
-        filtered_df = filtered_df[
-            filtered_df['headline'].str.contains(search_term, case=False, na=False)
-        ]
+        mask &= df['headline'].str.contains(search_term, case=False, regex=False, na=False)
     
-    return filtered_df
+    return df.loc[mask]
 
 def download_data(df, filename="cybersecurity_news.csv"):
     """
@@ -77,25 +77,42 @@ def download_data(df, filename="cybersecurity_news.csv"):
         mime="text/csv"
     )
 
-def save_data(df, filename="cybersecurity_news.csv"):
+def save_data(df, filename=DATA_FILE):
     """
-    Save DataFrame to CSV file
+    Save DataFrame to a Parquet file (typed, compressed and much faster to reload than CSV)
     
     Args:
         df: DataFrame to save
         filename: Name of the file to save
     """
     try:
-        df.to_csv(filename, index=False)
+        df.to_parquet(filename, engine="pyarrow", compression="snappy", index=False)
         logger.info(f"Data saved to {filename}")
         return True
     except Exception as e:
         logger.error(f"Error saving data to {filename}: {str(e)}")
         return False
 
-def load_data(filename="cybersecurity_news.csv"):
+def data_file_exists(filename=DATA_FILE):
+    """Check whether there is saved data to load (Parquet or the legacy CSV)"""
+    return os.path.exists(filename) or os.path.exists(LEGACY_DATA_FILE)
+
+def data_file_version(filename=DATA_FILE):
+    """
+    Return the modification time of the file load_data would read, so callers can tell
+    whether the saved data changed since they loaded it (None if there is no saved data)
     """
-    Load DataFrame from CSV file
+    if not os.path.exists(filename) and os.path.exists(LEGACY_DATA_FILE):
+        filename = LEGACY_DATA_FILE
+    
+    try:
+        return os.stat(filename).st_mtime_ns
+    except OSError:
+        return None
+
+def load_data(filename=DATA_FILE):
+    """
+    Load DataFrame from a Parquet file, falling back to the legacy CSV file
     
     Args:
         filename: Name of the file to load
@@ -104,13 +121,28 @@ def load_data(filename="cybersecurity_news.csv"):
         DataFrame or None if file not found
     """
     try:
+        if not os.path.exists(filename) and os.path.exists(LEGACY_DATA_FILE):
+            logger.info(f"File {filename} not found, loading {LEGACY_DATA_FILE} instead")
+            filename = LEGACY_DATA_FILE
+        
         if os.path.exists(filename):
-            df = pd.read_csv(filename)
+            if filename.endswith('.csv'):
+                df = pd.read_csv(filename)
+            else:
+                df = pd.read_parquet(filename, engine="pyarrow")
             
-            # Convert date column to datetime
+            # Convert date column to datetime (already typed when read from Parquet)
             if 'date' in df.columns:
                 df['date'] = pd.to_datetime(df['date'])
             
+            # Keep the article text Arrow-backed, like freshly processed data
+            text_columns = [column for column in ['headline', 'content'] if column in df.columns]
+            df = df.astype({column: pd.StringDtype("pyarrow") for column in text_columns})
+            
+            # Few distinct sources, so store them as a category (int codes for groupby/isin)
+            if 'source' in df.columns:
+                df['source'] = df['source'].astype('category')
+            
             logger.info(f"Data loaded from {filename}")
             return df
         else:
@@ -238,8 +270,8 @@ if __name__ == "__main__":
         df = pd.DataFrame(data)
         
         # Test save and load
-        save_data(df, "test_data.csv")
-        loaded_df = load_data("test_data.csv")
+        save_data(df, "test_data.parquet")
+        loaded_df = load_data("test_data.parquet")
         
         if loaded_df is not None:
             print("Data saved and loaded successfully")
@@ -251,7 +283,7 @@ if __name__ == "__main__":
         
         # Clean up test file
         try:
-            os.remove("test_data.csv")
+            os.remove("test_data.parquet")
         except:
             pass
     except Exception as e:
@@ -13,8 +13,9 @@ def plot_news_by_source(df):
     """Create a bar chart showing the distribution of news by source"""
     logger.info("Creating news by source visualization")
     
-    # Count news by source
-    source_counts = df['source'].value_counts().reset_index()
+    # Count news by source (skipping unused categories of a categorical source column)
+    source_counts = df['source'].value_counts()
+    source_counts = source_counts[source_counts > 0].reset_index()
     source_counts.columns = ['source', 'count']
     
     # Create bar chart
@@ -74,7 +75,7 @@ def plot_news_by_date(df):
     
     # Add source breakdown if available
     if len(df['source'].unique()) > 1:
-        source_date_counts = df.groupby([df['date'].dt.date, 'source']).size().reset_index(name='count')
+        source_date_counts = df.groupby([df['date'].dt.date, 'source'], observed=True).size().reset_index(name='count')
         source_date_counts.columns = ['date', 'source', 'count']
         
         # Add a line for each source
@@ -192,6 +193,27 @@ def plot_sentiment_over_time(sentiment_df):
     
     return fig
 
+def plot_source_sentiment(sentiment_df):
+    """Create a bar chart showing the average sentiment score of each source"""
+    logger.info("Creating source sentiment visualization")
+    
+    # Average polarity by source (only sources present in the data)
+    source_sentiment = sentiment_df.groupby('source', observed=True)['polarity'].mean().reset_index()
+    source_sentiment = source_sentiment.rename(columns={'polarity': 'sentiment_score'})
+    
+    # Create bar chart
+    fig = px.bar(
+        source_sentiment, 
+        x='source', 
+        y='sentiment_score',
+        color='sentiment_score',
+        color_continuous_scale=['red', 'yellow', 'green'],
+        title="Average Sentiment Score by Source",
+        labels={'sentiment_score': 'Sentiment Score (-1 to 1)'}
+    )
+    
+    return fig
+
 def plot_keyword_distribution(keyword_counts):
     """Create a bar chart showing the distribution of top keywords"""
     logger.info("Creating keyword distribution visualization")
@@ -236,8 +258,9 @@ def plot_source_reliability(df):
     """Create a visualization that shows the reliability or bias of news sources"""
     logger.info("Creating source reliability visualization")
     
-    # Count news sources
-    source_counts = df['source'].value_counts().reset_index()
+    # Count news sources (skipping unused categories of a categorical source column)
+    source_counts = df['source'].value_counts()
+    source_counts = source_counts[source_counts > 0].reset_index()
     source_counts.columns = ['source', 'total_articles']
     
     # This is a simplified metric - in a real app, you could have actual reliability metrics
@@ -375,8 +398,8 @@ def plot_threat_category_distribution(df):
     category_counts = {category: 0 for category in threat_categories}
     
     # Count mentions of each category
-    for _, row in df.iterrows():
-        content = f"{row['headline']} {row['content']}".lower()
+    for headline, content in zip(df['headline'].to_numpy(), df['content'].to_numpy()):
+        content = f"{headline} {content}".lower()
         
         for category, keywords in threat_categories.items():
             for keyword in keywords:
@@ -428,19 +451,14 @@ if __name__ == "__main__":
         
         # Create dummy sentiment data for testing
         sentiments = ['Positive', 'Neutral', 'Negative']
-        sentiment_data = []
-        
-        for _, row in df.iterrows():
-            sentiment_data.append({
-                'headline': row['headline'],
-                'source': row['source'],
-                'date': row['date'],
-                'sentiment': np.random.choice(sentiments),
-                'polarity': np.random.uniform(-1, 1),
-                'subjectivity': np.random.uniform(0, 1)
-            })
-        
-        sentiment_df = pd.DataFrame(sentiment_data)
+        sentiment_df = pd.DataFrame({
+            'headline': df['headline'].to_numpy(),
+            'source': df['source'].to_numpy(),
+            'date': df['date'].to_numpy(),
+            'sentiment': np.random.choice(sentiments, size=len(df)),
+            'polarity': np.random.uniform(-1, 1, size=len(df)),
+            'subjectivity': np.random.uniform(0, 1, size=len(df))
+        })
         
         # Test plot_sentiment_analysis
         fig3 = plot_sentiment_analysis(sentiment_df)